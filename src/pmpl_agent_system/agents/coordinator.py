@@ -1,28 +1,111 @@
 """メインコーディネーターエージェント"""
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 import asyncio
+import hashlib
+import json
+import os
 
 import structlog
 
-from ..llm.manager import LLMInterface
+from ..llm.manager import LLMInterface, trim_to_tokens
 from ..models.data import (
     DiscussionRound,
     DiscussionSession,
     DiscussionStatus,
     PersonaStatement,
 )
-from .personas import PersonaAgentFactory
+from .personas import PersonaAgent, PersonaAgentFactory
 
 logger = structlog.get_logger(__name__)
 
+# orjson は任意依存。あれば標準jsonより数倍速く、UTF-8のまま
+# コンパクトなバイト列を生成できるためキャッシュキー計算に使う
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 組織コンテキストの整形定義: (キー, ラベル, フォーマッター)
+_CTX_FIELDS = (
+    ("company_size", "組織規模", lambda v: f"{v}人"),
+    ("industry", "業界", str),
+    ("development_stage", "発展段階", str),
+    (
+        "current_challenges",
+        "現在の課題",
+        lambda v: ", ".join(v) if isinstance(v, list) else str(v),
+    ),
+    ("team_structure", "チーム構成", str),
+)
+
+
+class CoordinatorCache:
+    """コーディネーターのメタプロンプト応答キャッシュ
+
+    議題設定・焦点特定・合意枠組みなどのプロンプトはテンプレート化されて
+    おり、同一トピック・コンテキストのセッション間で繰り返される。
+    (モデル名, メッセージ列) の完全一致でキャッシュし、LLM往復を省略する。
+    LRUで上限件数に抑え、常駐プロセスでも無制限に溜め込まない。
+    """
+
+    # ペルソナの応答キャッシュ（_RESPONSE_CACHE_MAX）と同じ上限
+    _MAX_ENTRIES = 512
+
+    def __init__(self) -> None:
+        self._store: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def make_key(model_name: str, messages: List[Dict[str, str]]) -> str:
+        # ensure_ascii=False で日本語を \uXXXX に展開せず、ハッシュ対象の
+        # バイト列を短く保つ。blake2b は短いキー用途でSHA-256より高速
+        obj = {"model": model_name, "messages": messages}
+        if orjson is not None:
+            payload = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(
+                obj, sort_keys=True, ensure_ascii=False
+            ).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        response = self._store.get(key)
+        if response is not None:
+            self._store.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        self._store[key] = response
+        if len(self._store) > self._MAX_ENTRIES:
+            self._store.popitem(last=False)
+
 
 class MainCoordinator:
     """メインコーディネーターエージェント"""
     
-    def __init__(self, llm: LLMInterface):
+    def __init__(
+        self,
+        llm: LLMInterface,
+        cheap_llm: Optional[LLMInterface] = None,
+        max_concurrent_llm: int = 4,
+    ):
         self.llm = llm
+        # 議題設定・焦点特定・履歴圧縮などの低リスクなメタプロンプトは
+        # 安価で高速なモデルに振り分けられる（未指定時はメインLLMを使用）
+        self.cheap_llm = cheap_llm or llm
         self.persona_factory = PersonaAgentFactory()
+        # プロバイダーのレート制限を考慮し、同時LLM呼び出し数を制限する
+        # （設定値は discussion.max_concurrent_llm、環境変数で一時的に上書き可能）
+        self._sem = asyncio.Semaphore(
+            int(os.getenv("PMPL_LLM_CONCURRENCY", str(max_concurrent_llm)))
+        )
+        # メタプロンプト応答のキャッシュ
+        self._cache = CoordinatorCache()
+        # ペルソナエージェントのキャッシュ（発言のたびに再構築しない）
+        self._agent_cache: Dict[tuple[str, int], PersonaAgent] = {}
+        # 組織コンテキスト整形結果のメモ化
+        self._context_cache: Dict[str, str] = {}
         self.system_prompt = """
 あなたは複数のペルソナエージェントによる議論をファシリテートするメインコーディネーターです。
 
@@ -40,7 +123,33 @@ class MainCoordinator:
 
 対話的で深化した議論を通じて、10-50人規模IT組織の課題解決を目指してください。
 """
-    
+        # 全メタプロンプトで再利用する共通システムメッセージ
+        # （バイト単位で同一のプレフィックスはプロバイダー側キャッシュの前提条件）
+        self._system_msg = {"role": "system", "content": self.system_prompt}
+
+    async def _cached_generate(
+        self,
+        messages: List[Dict[str, str]],
+        llm: Optional[LLMInterface] = None
+    ) -> str:
+        """キャッシュ経由でメタプロンプトを生成
+
+        同一モデル・同一メッセージ列の呼び出しはキャッシュから即座に返す。
+        llm 引数でメタプロンプト用の安価なモデルを指定できる。
+        """
+        llm = llm or self.llm
+        key = CoordinatorCache.make_key(llm.model_name, messages)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("メタプロンプトキャッシュヒット", key=key[:12])
+            return cached
+
+        # コーディネーターのシステムプロンプトは全メタプロンプトで共通なので
+        # プロバイダー側のプロンプトキャッシュも併用する
+        response = await llm.generate(messages, cache_key="pmpl-coordinator")
+        self._cache.set(key, response)
+        return response
+
     async def start_discussion(
         self,
         session: DiscussionSession,
@@ -75,21 +184,48 @@ class MainCoordinator:
         organization_context: Dict[str, any],  # type: ignore
         llm_manager: 'LLMManager'  # type: ignore
     ) -> None:
-        """対話的議論の実施"""
+        """対話的議論の実施
+
+        各ステップの依存関係（DAG）:
+
+            agenda ─────────────┐（ログのみ・他ステップに非依存）
+            initial ─→ focus(2,3) ─→ interactive2 ─→ interactive3
+                                                          │
+                              consensus ←─────────────────┘
+                                  │
+                               summary
+
+        依存のないノードは既に並行実行している（agenda は initial と、
+        ラウンド内の各ペルソナ発言は互いに重なる）。残りのステップは
+        いずれも直前の結果に依存するクリティカルパス上にあるため、
+        汎用のタスクスケジューラを導入しても遅延は縮まない。
+        """
         context = self._format_organization_context(organization_context)
-        
+
         # Step 1: 論点整理と議題設定
-        agenda = await self._set_discussion_agenda(topic, context)
-        logger.info("議論の論点整理完了", agenda=agenda)
-        
+        # 議題は初期見解のプロンプトでは参照されないため、バックグラウンドで
+        # 生成を開始し、初期見解ラウンドとI/Oを重ねてレイテンシを隠蔽する
+        agenda_task = asyncio.create_task(
+            self._set_discussion_agenda(topic, context)
+        )
+
         # Step 2: 初期見解ラウンド
         await self._initial_statements_round(discussion_round, topic, context, llm_manager)
-        
+
         # Step 3: 相互議論ラウンド（2-3回）
+        # 焦点論点は初期見解の同一集合から導けるため、ラウンド2・3の分を
+        # 1回のLLM呼び出しでまとめて取得しメタプロンプト往復を半減する。
+        # 議題生成とは独立なので完了待ちも並行して行う
+        agenda, focus_points_by_round = await asyncio.gather(
+            agenda_task,
+            self._identify_focus_points_multi(discussion_round, rounds=(2, 3)),
+        )
+        logger.info("議論の論点整理完了", agenda=agenda)
         for round_num in range(2, 4):
-            logger.info(f"相互議論ラウンド{round_num}開始")
+            logger.info("相互議論ラウンド開始", round=round_num)
             await self._interactive_discussion_round(
-                discussion_round, topic, context, llm_manager, round_num
+                discussion_round, topic, context, llm_manager, round_num,
+                focus_points=focus_points_by_round.get(round_num)
             )
         
         # Step 4: 合意形成ラウンド  
@@ -101,7 +237,7 @@ class MainCoordinator:
     async def _set_discussion_agenda(self, topic: str, context: str) -> str:
         """議論の論点を整理し議題を設定"""
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            self._system_msg,
             {"role": "user", "content": f"""
 議論テーマ: {topic}
 コンテキスト: {context}
@@ -115,9 +251,69 @@ class MainCoordinator:
 """}
         ]
         
-        agenda = await self.llm.generate(messages)
+        agenda = await self._cached_generate(messages, llm=self.cheap_llm)
         return agenda
     
+    async def _run_persona_discussion(
+        self,
+        persona_name: str,
+        topic: str,
+        context: str,
+        llm_manager: 'LLMManager',  # type: ignore
+        snapshot_statements: List[PersonaStatement],
+        discussion_type: str,
+        round_number: int = 1,
+        totals: Optional[tuple] = None
+    ) -> PersonaStatement:
+        """単一ペルソナの発言を生成（並列実行用ヘルパー）
+
+        各タスクには起動時点の発言スナップショットを渡し、
+        並行実行中の add_statement による文脈の変化を防ぐ。
+        """
+        persona_llm = llm_manager.get_llm(persona_name)
+
+        # discuss は発言履歴を引数で受け取るステートレスな呼び出しなので、
+        # エージェント本体は (ペルソナ名, LLMインスタンス) ごとに再利用できる
+        cache_key = (persona_name, id(persona_llm))
+        persona_agent = self._agent_cache.get(cache_key)
+        if persona_agent is None:
+            persona_agent = self.persona_factory.create_agent(persona_name, persona_llm)
+            self._agent_cache[cache_key] = persona_agent
+
+        async with self._sem:
+            return await persona_agent.discuss(
+                topic,
+                context,
+                snapshot_statements,
+                discussion_type=discussion_type,
+                round_number=round_number,
+                defer_extraction=True,
+                totals=totals
+            )
+
+    async def _batch_fill_extractions(self, results: List[Any]) -> None:
+        """非JSON応答だった発言の課題・解決策を一括抽出で補完
+
+        構造化JSONに従った発言は生成時点で課題・解決策が揃っている。
+        従わなかった発言だけを集め、ラウンドあたり1回のLLM呼び出しで
+        まとめて抽出する（発言ごとのN回の往復を置き換える）。
+        """
+        pending = [
+            result for result in results
+            if isinstance(result, PersonaStatement)
+            and not result.identified_issues
+            and not result.proposed_solutions
+        ]
+        if not pending:
+            return
+
+        extracted = await PersonaAgentFactory.extract_batch(
+            self.cheap_llm, [stmt.statement for stmt in pending]
+        )
+        for stmt, (issues, solutions) in zip(pending, extracted):
+            stmt.identified_issues = issues
+            stmt.proposed_solutions = solutions
+
     async def _initial_statements_round(
         self,
         discussion_round: DiscussionRound,
@@ -127,28 +323,29 @@ class MainCoordinator:
     ) -> None:
         """初期見解表明ラウンド"""
         logger.info("初期見解表明ラウンド開始")
-        
-        for persona_name in discussion_round.participants:
-            try:
-                # ペルソナエージェントを作成
-                persona_llm = llm_manager.get_llm(persona_name)
-                persona_agent = self.persona_factory.create_agent(persona_name, persona_llm)
-                
-                # 初期見解を取得
-                statement = await persona_agent.discuss(
-                    topic,
-                    context,
-                    discussion_round.statements,
-                    discussion_type="initial"
-                )
-                
-                # 発言をラウンドに追加
-                discussion_round.add_statement(statement)
-                logger.info(f"{persona_name}の初期見解完了")
-                
-            except Exception as e:
-                logger.error("ペルソナ初期見解エラー", persona=persona_name, error=str(e))
+
+        # 全ペルソナが同じ初期コンテキストを参照するようスナップショットを作成
+        # （初期見解プロンプトは直近2件しか使わないため、直近ウィンドウで十分）
+        snapshot_statements = discussion_round.recent_statements()
+
+        # ペルソナごとのLLM呼び出しは独立したI/Oなので並列実行する
+        tasks = [
+            self._run_persona_discussion(
+                persona_name, topic, context, llm_manager,
+                snapshot_statements, discussion_type="initial"
+            )
+            for persona_name in discussion_round.participants
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self._batch_fill_extractions(results)
+
+        # 参加者順に発言を追加（順序を決定的に保つ）
+        for persona_name, result in zip(discussion_round.participants, results):
+            if isinstance(result, BaseException):
+                logger.error("ペルソナ初期見解エラー", persona=persona_name, error=str(result))
                 continue
+            discussion_round.add_statement(result)
+            logger.info("ペルソナ初期見解完了", persona=persona_name)
     
     async def _interactive_discussion_round(
         self,
@@ -156,44 +353,48 @@ class MainCoordinator:
         topic: str,
         context: str,
         llm_manager: 'LLMManager',  # type: ignore
-        round_num: int
+        round_num: int,
+        focus_points: Optional[str] = None
     ) -> None:
         """相互議論ラウンド"""
         # コーディネーターが焦点となる論点を特定
-        focus_points = await self._identify_focus_points(discussion_round.statements, round_num)
-        logger.info(f"ラウンド{round_num}の焦点論点", focus_points=focus_points)
+        # （バッチ取得済みの場合はそれを使い、個別のLLM往復を省略する）
+        if focus_points is None:
+            focus_points = await self._identify_focus_points(discussion_round, round_num)
+        logger.info("焦点論点特定完了", round=round_num, focus_points=focus_points)
         
         # 各ペルソナに他者の意見への応答を求める
-        for persona_name in discussion_round.participants:
-            try:
-                persona_llm = llm_manager.get_llm(persona_name)
-                persona_agent = self.persona_factory.create_agent(persona_name, persona_llm)
-                
-                # 他のペルソナの意見に対する応答を取得
-                statement = await persona_agent.discuss(
-                    topic,
-                    context + f"\n\n焦点論点: {focus_points}",
-                    discussion_round.statements,
-                    discussion_type="interactive",
-                    round_number=round_num
-                )
-                
-                discussion_round.add_statement(statement)
-                logger.info(f"{persona_name}のラウンド{round_num}応答完了")
-                
-            except Exception as e:
-                logger.error("ペルソナ相互議論エラー", persona=persona_name, round=round_num, error=str(e))
+        # 全タスクが同じ前ラウンドの文脈に応答するようスナップショットを固定する
+        # （相互議論プロンプトは直近5件のみ参照するため、直近ウィンドウを渡す。
+        # 全発言リストのコピーを議論の長さに比例させない）
+        snapshot_statements = discussion_round.recent_statements()
+        # 拡張コンテキストはラウンド内で不変なので1回だけ構築する
+        extended_context = f"{context}\n\n焦点論点: {focus_points}"
+        tasks = [
+            self._run_persona_discussion(
+                persona_name, topic, extended_context,
+                llm_manager, snapshot_statements,
+                discussion_type="interactive", round_number=round_num
+            )
+            for persona_name in discussion_round.participants
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self._batch_fill_extractions(results)
+
+        for persona_name, result in zip(discussion_round.participants, results):
+            if isinstance(result, BaseException):
+                logger.error("ペルソナ相互議論エラー", persona=persona_name, round=round_num, error=str(result))
                 continue
+            discussion_round.add_statement(result)
+            logger.info("ペルソナ相互議論応答完了", persona=persona_name, round=round_num)
     
-    async def _identify_focus_points(self, statements: List[PersonaStatement], round_num: int) -> str:
+    async def _identify_focus_points(self, discussion_round: DiscussionRound, round_num: int) -> str:
         """議論の焦点となる論点を特定"""
-        statements_summary = "\n\n".join([
-            f"{stmt.persona_name}: {stmt.statement[:300]}..."
-            for stmt in statements[-5:]  # 最新5件の発言
-        ])
+        # ラウンド側が保持する直近5件の整形済みサマリーを利用する
+        statements_summary = discussion_round.recent_summary()
         
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            self._system_msg,
             {"role": "user", "content": f"""
 これまでの議論:
 {statements_summary}
@@ -207,7 +408,7 @@ class MainCoordinator:
 """}
         ]
         
-        focus_points = await self.llm.generate(messages)
+        focus_points = await self._cached_generate(messages, llm=self.cheap_llm)
         return focus_points
     
     async def _consensus_building_round(
@@ -221,37 +422,136 @@ class MainCoordinator:
         logger.info("合意形成ラウンド開始")
         
         # これまでの議論を統合し、合意点を整理
-        consensus_framework = await self._build_consensus_framework(discussion_round.statements)
-        
-        # 各ペルソナに最終的な統合見解を求める
-        for persona_name in discussion_round.participants:
-            try:
-                persona_llm = llm_manager.get_llm(persona_name)
-                persona_agent = self.persona_factory.create_agent(persona_name, persona_llm)
-                
-                statement = await persona_agent.discuss(
-                    topic,
-                    context + f"\n\n合意形成の枠組み: {consensus_framework}",
-                    discussion_round.statements,
-                    discussion_type="consensus"
-                )
-                
-                discussion_round.add_statement(statement)
-                logger.info(f"{persona_name}の合意形成完了")
-                
-            except Exception as e:
-                logger.error("ペルソナ合意形成エラー", persona=persona_name, error=str(e))
+        consensus_framework = await self._build_consensus_framework(discussion_round)
+
+        # 各ペルソナに最終的な統合見解を求める（初期見解ラウンドと同様に並列実行）
+        # 合意形成プロンプトが必要とするのは全議論の課題・解決策件数のみで、
+        # ラウンドが増分維持している集計リストの長さからO(1)で得られる。
+        # 発言スナップショットは直近ウィンドウで十分
+        snapshot_statements = discussion_round.recent_statements()
+        totals = (
+            len(discussion_round.identified_issues),
+            len(discussion_round.proposed_solutions),
+        )
+        # 拡張コンテキストはラウンド内で不変なので1回だけ構築する
+        extended_context = f"{context}\n\n合意形成の枠組み: {consensus_framework}"
+        tasks = [
+            self._run_persona_discussion(
+                persona_name, topic, extended_context,
+                llm_manager, snapshot_statements,
+                discussion_type="consensus", totals=totals
+            )
+            for persona_name in discussion_round.participants
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self._batch_fill_extractions(results)
+
+        for persona_name, result in zip(discussion_round.participants, results):
+            if isinstance(result, BaseException):
+                logger.error("ペルソナ合意形成エラー", persona=persona_name, error=str(result))
                 continue
+            discussion_round.add_statement(result)
+            logger.info("ペルソナ合意形成完了", persona=persona_name)
     
-    async def _build_consensus_framework(self, statements: List[PersonaStatement]) -> str:
+    async def _identify_focus_points_multi(
+        self,
+        discussion_round: DiscussionRound,
+        rounds: tuple = (2, 3)
+    ) -> Dict[int, str]:
+        """複数ラウンド分の焦点論点を1回のLLM呼び出しで特定
+
+        ラウンド2・3の焦点はどちらも初期見解の集合から導出されるため、
+        構造化JSONでまとめて取得し、メタプロンプトの往復回数を削減する。
+        パースに失敗した場合は空のdictを返し、呼び出し側が
+        ラウンドごとの個別取得にフォールバックする。
+        """
+        statements_summary = discussion_round.recent_summary()
+
+        round_keys = ", ".join(f'"round_{n}"' for n in rounds)
+        messages = [
+            self._system_msg,
+            {"role": "user", "content": f"""
+これまでの議論:
+{statements_summary}
+
+続く{len(rounds)}回の相互議論ラウンドそれぞれで焦点を当てるべき論点を特定してください：
+1. 意見が分かれている点
+2. さらに深掘りが必要な課題
+3. 具体的な解決策が求められている領域
+
+各ラウンドについて、参加者が応答すべき具体的な問いかけを3つ提示してください。
+後のラウンドほど議論を深化させる問いかけにしてください。
+
+以下のキーを持つJSONオブジェクトのみを出力してください: {{{round_keys}}}
+"""}
+        ]
+
+        try:
+            response = await self._cached_generate(messages, llm=self.cheap_llm)
+            # コードブロック等で囲まれていても中のJSONを拾う
+            start = response.find("{")
+            end = response.rfind("}")
+            parsed = json.loads(response[start:end + 1])
+            return {
+                n: parsed[f"round_{n}"]
+                for n in rounds
+                if f"round_{n}" in parsed
+            }
+        except Exception as e:
+            logger.warning("焦点論点の一括取得に失敗", error=str(e))
+            return {}
+
+    async def _compress_history(
+        self,
+        discussion_round: DiscussionRound,
+        keep_last: int = 6
+    ) -> str:
+        """議論履歴を圧縮して返す
+
+        直近 keep_last 件の発言は原文のまま残し、それ以前の発言は
+        LLMで要約して置き換える。合意形成・総まとめのプロンプトに
+        全発言を逐語で詰め込むと入力トークンが肥大化するため。
+        要約は _cached_generate 経由なので、同一セッション内の
+        合意形成と総まとめで再利用される。
+        """
+        statements = discussion_round.statements
+        if len(statements) <= keep_last:
+            return discussion_round.formatted_all()
+
+        # 1発言あたりのトークン量に上限を設け、入力の線形肥大化を防ぐ
+        older_text = "\n\n".join(
+            f"{stmt.persona_name}({stmt.persona_role}): "
+            f"{trim_to_tokens(stmt.statement, 400)}"
+            for stmt in statements[:-keep_last]
+        )
+        messages = [
+            self._system_msg,
+            {"role": "user", "content": f"""
+以下は議論の前半部分の発言です。各ペルソナの主要な主張・特定した課題・
+提案した解決策を落とさずに、全体を簡潔に要約してください。
+
+{older_text}
+"""}
+        ]
+        head_summary = await self._cached_generate(messages, llm=self.cheap_llm)
+
+        recent_text = "\n\n".join(
+            f"{stmt.persona_name}({stmt.persona_role}): "
+            f"{trim_to_tokens(stmt.statement, 400)}"
+            for stmt in statements[-keep_last:]
+        )
+        return (
+            f"【これまでの議論の要約】\n{head_summary}\n\n"
+            f"【直近の発言】\n{recent_text}"
+        )
+
+    async def _build_consensus_framework(self, discussion_round: DiscussionRound) -> str:
         """合意形成の枠組みを構築"""
-        all_statements = "\n\n".join([
-            f"{stmt.persona_name}({stmt.persona_role}): {stmt.statement}"
-            for stmt in statements
-        ])
+        # 履歴を圧縮し、入力トークン量を抑える
+        all_statements = await self._compress_history(discussion_round)
         
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            self._system_msg,
             {"role": "user", "content": f"""
 これまでの全議論:
 {all_statements}
@@ -266,36 +566,32 @@ class MainCoordinator:
 """}
         ]
         
-        framework = await self.llm.generate(messages)
+        framework = await self._cached_generate(messages)
         return framework
 
     def _format_organization_context(self, context: Dict[str, any]) -> str:  # type: ignore
-        """組織コンテキストを文字列にフォーマット"""
+        """組織コンテキストを文字列にフォーマット
+
+        整形定義は _CTX_FIELDS のディスパッチテーブルに集約している。
+        コンテキストはセッション中不変なのでインスタンス単位でメモ化する。
+        """
         if not context:
             return ""
-        
-        formatted_parts = []
-        
-        if "company_size" in context:
-            formatted_parts.append(f"組織規模: {context['company_size']}人")
-        
-        if "industry" in context:
-            formatted_parts.append(f"業界: {context['industry']}")
-        
-        if "development_stage" in context:
-            formatted_parts.append(f"発展段階: {context['development_stage']}")
-        
-        if "current_challenges" in context:
-            challenges = context["current_challenges"]
-            if isinstance(challenges, list):
-                formatted_parts.append(f"現在の課題: {', '.join(challenges)}")
-            else:
-                formatted_parts.append(f"現在の課題: {challenges}")
-        
-        if "team_structure" in context:
-            formatted_parts.append(f"チーム構成: {context['team_structure']}")
-        
-        return "\n".join(formatted_parts)
+
+        memo_key = json.dumps(
+            context, sort_keys=True, ensure_ascii=False, default=str
+        )
+        cached = self._context_cache.get(memo_key)
+        if cached is not None:
+            return cached
+
+        formatted = "\n".join(
+            f"{label}: {fmt(context[key])}"
+            for key, label, fmt in _CTX_FIELDS
+            if key in context
+        )
+        self._context_cache[memo_key] = formatted
+        return formatted
 
     async def _generate_discussion_summary(
         self,
@@ -307,22 +603,13 @@ class MainCoordinator:
         logger.info("議論総まとめ開始")
         
         try:
-            # 全ての発言を統合
-            all_statements = "\n\n".join([
-                f"【{stmt.persona_name}（{stmt.persona_role}）】\n{stmt.statement}"
-                for stmt in discussion_round.statements
-            ])
-            
-            # 特定された課題を統合
-            all_issues = []
-            for stmt in discussion_round.statements:
-                all_issues.extend(stmt.identified_issues)
-            
-            # 提案された解決策を統合
-            all_solutions = []
-            for stmt in discussion_round.statements:
-                all_solutions.extend(stmt.proposed_solutions)
-            
+            # 全ての発言を統合（履歴圧縮により入力トークン量を抑える）
+            all_statements = await self._compress_history(discussion_round)
+
+            # ラウンド側で集計済みの課題・解決策を利用
+            all_issues = discussion_round.identified_issues
+            all_solutions = discussion_round.proposed_solutions
+
             # コーディネーターによる総まとめを生成
             messages = [
                 {"role": "system", "content": f"""
@@ -355,8 +642,21 @@ class MainCoordinator:
 """}
             ]
             
-            summary = await self.llm.generate(messages)
-            
+            # 総まとめはセッション中最長の生成になるため、ストリーミングで
+            # 受信して進捗を逐次ログに出す（完了待ちの見かけ上の停止を防ぐ）
+            key = CoordinatorCache.make_key(self.llm.model_name, messages)
+            cached = self._cache.get(key)
+            if cached is not None:
+                summary = cached
+            else:
+                parts: List[str] = []
+                async for chunk in self.llm.stream(messages):
+                    parts.append(chunk)
+                    if len(parts) % 50 == 0:
+                        logger.info("総まとめ生成中", chunks=len(parts))
+                summary = "".join(parts)
+                self._cache.set(key, summary)
+
             # 総まとめをPersonaStatementとして記録
             from datetime import datetime
             summary_statement = PersonaStatement(
@@ -1,17 +1,119 @@
 """ペルソナエージェントシステム"""
 
+import hashlib
+import json
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import structlog
 import yaml
 
-from ..llm.manager import LLMInterface
-from ..models.data import PersonaStatement
+# libyaml があればCベースのローダーで5-10倍速くパースできる
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from ..llm.manager import LLMInterface, trim_to_tokens
+from ..models.data import PersonaResponse, PersonaStatement
 
 logger = structlog.get_logger(__name__)
 
+# orjson は任意依存。あれば標準jsonより数倍速くLLM応答のJSONをパースできる
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# キーワードベース抽出用のパターン。行ごとにキーワードリストを
+# ループする代わりに、コンパイル済みの選択肢パターンで1走査にする
+_ISSUE_KEYWORDS = (
+    "課題", "問題", "困っている", "難しい", "悩み", "リスク",
+    "不足", "欠如", "足りない", "改善が必要", "ボトルネック"
+)
+_SOLUTION_KEYWORDS = (
+    "解決策", "対策", "改善案", "提案", "施策", "アプローチ",
+    "実施すべき", "導入", "取り組み", "方法", "戦略"
+)
+# 課題・解決策を名前付きグループで統合した単一パターン。
+# 1行につき1回の走査で済み、lastgroup で振り分け先が決まる
+_KEYWORD_RE = re.compile(
+    "(?P<issues>{})|(?P<solutions>{})".format(
+        "|".join(map(re.escape, _ISSUE_KEYWORDS)),
+        "|".join(map(re.escape, _SOLUTION_KEYWORDS)),
+    )
+)
+
+# 「1. 内容」形式の番号付き項目（2桁以上やインデントにも対応）
+_NUM_ITEM_RE = re.compile(r"^\s*\d+\.\s*(.+)")
+# セクション見出し → 抽出先の対応
+_SECTION_MAP = {"課題": "issues", "解決策": "solutions"}
+
+# 発言と課題・解決策を1回の生成で受け取るためのJSON出力指示
+_JSON_FORMAT_INSTRUCTION = """
+**出力形式:**
+以下のキーを持つJSONオブジェクトのみを出力してください：
+- "statement": 上記の指示に沿った発言本文（文字列）
+- "issues": 特定した課題のリスト（文字列の配列、最大5件）
+- "solutions": 提案した解決策のリスト（文字列の配列、最大5件）
+"""
+
+
+def _parse_persona_response(response: str) -> PersonaResponse | None:
+    """LLM応答から構造化されたPersonaResponseを取り出す
+
+    コードブロック等で囲まれていても中のJSONを拾う。
+    パースできない場合はNoneを返し、呼び出し側が従来の抽出に
+    フォールバックする。
+    """
+    start = response.find("{")
+    end = response.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        return PersonaResponse.model_validate_json(response[start:end + 1])
+    except Exception:
+        return None
+
+# 議論タイプ別のシステムプロンプト末尾（プロファイルに依存しない定数部分）。
+# 呼び出しごとのif/elif分岐と文字列連結を避け、辞書引き1回で済ませる
+_SYSTEM_SUFFIX: dict[str, str] = {
+    "initial": """
+**このラウンドでの役割:**
+議論テーマについて、あなたの専門性と経験に基づく初期見解を表明してください。
+- 重要と考える課題を3-5個特定する
+- 各課題に対する実践的な解決策を提案する
+- 具体的な事例や経験を交えて説明する
+""",
+    "interactive": """
+**このラウンドでの役割:**
+他の参加者の意見を踏まえ、対話的な議論を行ってください。
+- 他者の意見に対する同意点・相違点を明確化する
+- 新たな視点や見落とされた課題があれば指摘する
+- 実践的な改善案や代替案を提案する
+- 建設的な議論を通じて課題理解を深化させる
+""",
+    "consensus": """
+**このラウンドでの役割:**
+これまでの議論を統合し、合意形成に向けた最終見解を提示してください。
+- 議論で合意された重要な課題をまとめる
+- 実現可能性の高い解決策を優先順位付けする
+- 組織の段階的な改善計画を提案する
+- 今後の課題として残る論点を整理する
+""",
+}
+
+# エージェントローカルの応答キャッシュの上限エントリ数
+_RESPONSE_CACHE_MAX = 512
+
+# 履歴に含める1発言あたりのトークン上限。
+# 直近5件 × 400トークンで履歴全体がおよそ2000トークンに収まる
+_HISTORY_TOKENS_PER_STATEMENT = 400
+
 # デフォルトのペルソナ設定ファイルパス
 # リポジトリルートの `config/personas.yaml` を参照する
 DEFAULT_PERSONA_PATH = (
@@ -19,28 +121,93 @@ DEFAULT_PERSONA_PATH = (
 )
 
 
-@dataclass
+def _stat_mtime_ns(yaml_path: Path) -> int:
+    """設定ファイルの更新時刻を取得（存在チェック込み）"""
+    try:
+        return yaml_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"ペルソナ設定ファイルが見つかりません: {yaml_path}"
+        ) from None
+
+
+@lru_cache(maxsize=8)
+def _load_persona_yaml(yaml_path: Path, mtime_ns: int) -> dict:
+    """ペルソナ設定YAMLを読み込み（パス・更新時刻ごとに1回だけパース）
+
+    エージェント作成のたびにファイルI/OとYAMLパースを繰り返さない。
+    キーに更新時刻を含めるため、ファイル編集でキャッシュは自然に
+    無効化される。返り値は読み取り専用として扱うこと。
+    """
+    with open(yaml_path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+@lru_cache(maxsize=8)
+def _build_persona_configs(
+    yaml_path: Path, mtime_ns: int
+) -> "dict[str, PersonaConfig]":
+    """ペルソナ設定オブジェクトを構築（パス・更新時刻ごとに1回だけ）"""
+    data: dict[str, Any] = _load_persona_yaml(yaml_path, mtime_ns)
+
+    configs = {}
+    for name, persona in data.get("personas", {}).items():
+        config_data = persona.get("config")
+        if config_data:
+            # frozen な設定を実質的にも不変にするためリストはタプルへ変換
+            config_data = dict(config_data)
+            config_data["expertise_areas"] = tuple(
+                config_data.get("expertise_areas", ())
+            )
+            configs[name] = PersonaConfig(**config_data)
+
+    return configs
+
+
+@lru_cache(maxsize=8)
+def _build_persona_profiles(
+    yaml_path: Path, mtime_ns: int
+) -> "dict[str, PersonaProfile]":
+    """ペルソナプロファイルオブジェクトを構築（パス・更新時刻ごとに1回だけ）"""
+    data: dict[str, Any] = _load_persona_yaml(yaml_path, mtime_ns)
+
+    profiles = {}
+    for name, persona in data.get("personas", {}).items():
+        profile_data = persona.get("profile")
+        if profile_data:
+            profile_data = dict(profile_data)
+            specialties = tuple(profile_data.get("specialties", ()))
+            profile_data["specialties"] = specialties
+            profile_data["specialties_preview"] = "、".join(specialties[:3])
+            profiles[name] = PersonaProfile(**profile_data)
+
+    return profiles
+
+
+@dataclass(frozen=True, slots=True)
 class PersonaConfig:
     """ペルソナ設定"""
     name: str
     role: str
     experience_years: int
     organization_type: str
-    expertise_areas: list[str]
+    expertise_areas: tuple[str, ...]
     system_prompt: str
     llm_config: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonaProfile:
     """ペルソナプロファイル"""
     name: str
     role: str
     company_type: str
     experience_years: str
-    specialties: list[str]
+    specialties: tuple[str, ...]
     perspective: str
     communication_style: str
+    # レポートの参加者表で使う先頭3件の専門領域（構築時に1回だけ結合）
+    specialties_preview: str = ""
 
 
 class PersonaAgent:
@@ -49,6 +216,29 @@ class PersonaAgent:
     def __init__(self, llm: LLMInterface, profile: PersonaProfile):
         self.llm = llm
         self.profile = profile
+        # ペルソナ名は不変なので、イベントごとにkwargsへ詰め直さず
+        # 一度だけバインドしたロガーを使い回す
+        self._log = logger.bind(persona=profile.name)
+        # モデル名はLLMインスタンスごとに不変なので、発言のたびの
+        # hasattr による属性リフレクションを避けて一度だけ解決する
+        self._model_name = getattr(llm, "model_name", "unknown")
+        # プロファイルは不変なので、議論タイプ別システムプロンプトは
+        # 構築時に一度だけ生成する（バイト同一のプレフィックスは
+        # プロバイダー側プロンプトキャッシュの前提条件）
+        self._sys_prompt_base = self._generate_base_prompt()
+        self._system_prompts = {
+            discussion_type: self._sys_prompt_base + suffix
+            for discussion_type, suffix in _SYSTEM_SUFFIX.items()
+        }
+        # 議論タイプ → ユーザープロンプトビルダーのディスパッチ表
+        self._user_builders = {
+            "initial": self._user_prompt_initial,
+            "interactive": self._user_prompt_interactive,
+            "consensus": self._user_prompt_consensus,
+        }
+        # 同一入力の再実行（開発・再試行時）でLLM往復を省く応答キャッシュ
+        # （LRU: ヒット時に末尾へ移動し、上限超過時は先頭から追い出す）
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
 
     async def discuss(
         self,
@@ -56,7 +246,10 @@ class PersonaAgent:
         context: str,
         previous_statements: list[PersonaStatement],
         discussion_type: str = "initial",
-        round_number: int = 1
+        round_number: int = 1,
+        defer_extraction: bool = False,
+        use_cache: bool = True,
+        totals: "tuple[int, int] | None" = None
     ) -> PersonaStatement:
         """議論に参加して発言を生成
         Args:
@@ -65,12 +258,21 @@ class PersonaAgent:
             previous_statements: これまでの発言
             discussion_type: 議論タイプ（initial/interactive/consensus）
             round_number: ラウンド数
+            defer_extraction: Trueなら非JSON応答時の課題・解決策抽出を
+                呼び出し側（ラウンド単位の一括抽出）に委ねる
+            use_cache: Falseで応答キャッシュを無効化し、毎回新しい
+                応答を生成する（非決定的な出力が必要な場合）
+            totals: 全議論の (課題件数, 解決策件数)。合意形成プロンプトで
+                使用し、指定があれば発言リストの再集計を省略する
         """
 
-        # 議論タイプに応じたプロンプトを生成
-        system_prompt = self._generate_system_prompt(discussion_type)
+        # 議論タイプに応じたプロンプトを取得（構築時に生成済み）
+        system_prompt = self._system_prompts.get(
+            discussion_type
+        ) or self._generate_system_prompt(discussion_type)
         user_prompt = self._generate_user_prompt(
-            topic, context, previous_statements, discussion_type, round_number
+            topic, context, previous_statements, discussion_type, round_number,
+            totals=totals
         )
 
         messages = [
@@ -78,25 +280,66 @@ class PersonaAgent:
             {"role": "user", "content": user_prompt}
         ]
 
-        # LLMから発言を生成
-        response = await self.llm.generate(messages)
-
-        # 課題と解決策を抽出
-        issues, solutions = await self._extract_issues_and_solutions(response)
-
-        # PersonaStatementを作成
-        statement = PersonaStatement(
+        # 同一入力（ペルソナ・議論タイプ・ラウンド・全プロンプト）の
+        # 再実行はローカルキャッシュから即座に応答を返す
+        cache_key_local = None
+        if use_cache:
+            h = hashlib.blake2b(digest_size=16)
+            for part in (
+                self.profile.name, discussion_type, str(round_number),
+                system_prompt, user_prompt
+            ):
+                h.update(part.encode("utf-8"))
+                h.update(b"\x00")
+            cache_key_local = h.hexdigest()
+            cached = self._response_cache.get(cache_key_local)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key_local)
+                self._log.info("ペルソナ応答キャッシュヒット", key=cache_key_local[:12])
+                response = cached
+            else:
+                response = None
+        else:
+            response = None
+
+        if response is None:
+            # LLMから発言を生成（課題・解決策込みの構造化JSONを要求）。
+            # ペルソナの定型プレフィックスはプロバイダー側キャッシュを効かせる
+            response = await self.llm.generate(
+                messages, cache_key=f"pmpl-persona-{self.profile.name}"
+            )
+            if cache_key_local is not None:
+                self._response_cache[cache_key_local] = response
+                if len(self._response_cache) > _RESPONSE_CACHE_MAX:
+                    self._response_cache.popitem(last=False)
+
+        # 構造化応答なら1回の生成で発言と課題・解決策が揃う。
+        # JSONに従わない応答は従来の抽出フローにフォールバックする
+        parsed = _parse_persona_response(response)
+        if parsed is not None:
+            statement_text = parsed.statement
+            issues, solutions = parsed.issues[:5], parsed.solutions[:5]
+        elif defer_extraction:
+            # ラウンド側が全ペルソナ分をまとめて1回のLLM呼び出しで抽出する
+            statement_text = response
+            issues, solutions = [], []
+        else:
+            statement_text = response
+            issues, solutions = await self._extract_issues_and_solutions(response)
+
+        # PersonaStatementを作成。値はスキーマ検証済みのレスポンス由来
+        # なので model_construct で再バリデーションを省略する
+        statement = PersonaStatement.model_construct(
             persona_name=self.profile.name,
             persona_role=self.profile.role,
-            statement=response,
+            statement=statement_text,
             identified_issues=issues,
             proposed_solutions=solutions,
-            llm_model=self.llm.model_name if hasattr(self.llm, 'model_name') else "unknown"
+            llm_model=self._model_name
         )
 
-        logger.info(
+        self._log.info(
             "ペルソナ発言生成完了",
-            persona=self.profile.name,
             discussion_type=discussion_type,
             round=round_number,
             issues_count=len(issues),
@@ -105,9 +348,9 @@ class PersonaAgent:
 
         return statement
 
-    def _generate_system_prompt(self, discussion_type: str) -> str:
-        """議論タイプに応じたシステムプロンプトを生成"""
-        base_prompt = f"""
+    def _generate_base_prompt(self) -> str:
+        """プロファイル由来のシステムプロンプト共通部分を生成"""
+        return f"""
 あなたは{self.profile.name}（{self.profile.role}）として行動してください。
 
 **あなたのプロファイル:**
@@ -124,36 +367,9 @@ class PersonaAgent:
 - 人材マネジメントとプロセス改善の実用的解決策を重視する
 """
 
-        if discussion_type == "initial":
-            return base_prompt + """
-**このラウンドでの役割:**
-議論テーマについて、あなたの専門性と経験に基づく初期見解を表明してください。
-- 重要と考える課題を3-5個特定する
-- 各課題に対する実践的な解決策を提案する
-- 具体的な事例や経験を交えて説明する
-"""
-
-        elif discussion_type == "interactive":
-            return base_prompt + """
-**このラウンドでの役割:**
-他の参加者の意見を踏まえ、対話的な議論を行ってください。
-- 他者の意見に対する同意点・相違点を明確化する
-- 新たな視点や見落とされた課題があれば指摘する
-- 実践的な改善案や代替案を提案する
-- 建設的な議論を通じて課題理解を深化させる
-"""
-
-        elif discussion_type == "consensus":
-            return base_prompt + """
-**このラウンドでの役割:**
-これまでの議論を統合し、合意形成に向けた最終見解を提示してください。
-- 議論で合意された重要な課題をまとめる
-- 実現可能性の高い解決策を優先順位付けする
-- 組織の段階的な改善計画を提案する
-- 今後の課題として残る論点を整理する
-"""
-
-        return base_prompt
+    def _generate_system_prompt(self, discussion_type: str) -> str:
+        """議論タイプに応じたシステムプロンプトを取得"""
+        return self._system_prompts.get(discussion_type, self._sys_prompt_base)
 
     def _generate_user_prompt(
         self,
@@ -161,70 +377,151 @@ class PersonaAgent:
         context: str,
         previous_statements: list[PersonaStatement],
         discussion_type: str,
-        round_number: int
+        round_number: int,
+        totals: "tuple[int, int] | None" = None
     ) -> str:
-        """ユーザープロンプトを生成"""
-        prompt = f"""
+        """ユーザープロンプトを生成
+
+        議論タイプごとの組み立てロジックは専用メソッドに分離し、
+        辞書引き1回でディスパッチする（呼び出しごとの文字列比較の
+        連鎖を排除し、プロファイラ上のホットスポットも分離される）。
+        """
+        builder = self._user_builders.get(
+            discussion_type, self._user_prompt_generic
+        )
+        return builder(topic, context, previous_statements, round_number, totals)
+
+    @staticmethod
+    def _user_prompt_header(topic: str, context: str) -> str:
+        """全議論タイプ共通のプロンプト先頭部分
+
+        プロンプトキャッシュのヒット率を高めるため、セッション内で安定な
+        テーマ・コンテキストを先頭に置き、毎ターン変わる発言履歴は
+        各ビルダーが末尾に配置する。
+        """
+        return f"""
 **議論テーマ:** {topic}
 
 **組織コンテキスト:**
 {context}
 """
 
+    def _user_prompt_initial(
+        self,
+        topic: str,
+        context: str,
+        previous_statements: list[PersonaStatement],
+        round_number: int,
+        totals: "tuple[int, int] | None" = None
+    ) -> str:
+        """初期見解表明用のユーザープロンプトを組み立てる"""
+        # 繰り返しの += によるO(n²)の文字列連結を避け、リスト+joinで組み立てる
+        parts: list[str] = [
+            self._user_prompt_header(topic, context),
+            "\n**回答形式:**\n"
+            "あなたの専門性に基づく見解を詳細に述べてください。具体的な事例や経験談を含めて説明し、実践的な課題と解決策を提示してください。\n",
+        ]
+
         if previous_statements:
-            if discussion_type == "initial":
-                # 初期ラウンドでは他者の発言は参考程度
-                if len(previous_statements) > 0:
-                    recent_statements = previous_statements[-2:]  # 最新2件
-                    prompt += "\n**これまでの発言（参考）:**\n"
-                    for stmt in recent_statements:
-                        prompt += f"- {stmt.persona_name}: {stmt.statement[:200]}...\n"
-
-            elif discussion_type == "interactive":
-                # 相互議論では他者の意見に対する応答を重視
-                prompt += "\n**これまでの議論:**\n"
-                for stmt in previous_statements[-5:]:  # 最新5件
-                    prompt += f"\n**{stmt.persona_name}（{stmt.persona_role}）の見解:**\n"
-                    prompt += f"{stmt.statement}\n"
-
-                prompt += f"\n**ラウンド{round_number}での議論指針:**\n"
-                prompt += "上記の意見を踏まえ、以下の観点で応答してください：\n"
-                prompt += "1. 他者の意見で共感する点・疑問に思う点\n"
-                prompt += "2. あなたの経験から見た追加の課題や視点\n"
-                prompt += "3. より実現可能性の高い解決策の提案\n"
-                prompt += "4. 具体的な実装方法や注意点\n"
-
-            elif discussion_type == "consensus":
-                # 合意形成では全体的な統合を重視
-                prompt += "\n**全議論の要約:**\n"
-                all_issues = []
-                all_solutions = []
-                for stmt in previous_statements:
-                    all_issues.extend(stmt.identified_issues)
-                    all_solutions.extend(stmt.proposed_solutions)
-
-                prompt += f"特定された課題: {len(all_issues)}件\n"
-                prompt += f"提案された解決策: {len(all_solutions)}件\n"
-
-                prompt += "\n**合意形成の観点:**\n"
-                prompt += "1. 最も重要で合意可能な課題を3つ選定する\n"
-                prompt += "2. 実現可能性が高い解決策を優先順位付けする\n"
-                prompt += "3. 段階的な実装計画を提案する\n"
-                prompt += "4. 効果測定の指標を提案する\n"
-
-        if discussion_type == "initial":
-            prompt += "\n**回答形式:**\n"
-            prompt += "あなたの専門性に基づく見解を詳細に述べてください。具体的な事例や経験談を含めて説明し、実践的な課題と解決策を提示してください。"
-
-        elif discussion_type == "interactive":
-            prompt += "\n**回答形式:**\n"
-            prompt += "他者の意見を引用しながら、対話的な形式で応答してください。合意点と相違点を明確にし、建設的な議論を促進する内容としてください。"
-
-        elif discussion_type == "consensus":
-            prompt += "\n**回答形式:**\n"
-            prompt += "これまでの議論を統合した最終見解を提示してください。合意事項、実行計画、今後の課題を明確に整理してください。"
-
-        return prompt
+            # 初期ラウンドでは他者の発言は参考程度
+            parts.append("\n**これまでの発言（参考）:**\n")
+            parts.append("".join(
+                f"- {stmt.persona_name}: {stmt.preview}...\n"
+                for stmt in previous_statements[-2:]  # 最新2件
+            ))
+
+        parts.append(_JSON_FORMAT_INSTRUCTION)
+        return "".join(parts)
+
+    def _user_prompt_interactive(
+        self,
+        topic: str,
+        context: str,
+        previous_statements: list[PersonaStatement],
+        round_number: int,
+        totals: "tuple[int, int] | None" = None
+    ) -> str:
+        """相互議論用のユーザープロンプトを組み立てる"""
+        parts: list[str] = [
+            self._user_prompt_header(topic, context),
+            "\n**回答形式:**\n"
+            "他者の意見を引用しながら、対話的な形式で応答してください。合意点と相違点を明確にし、建設的な議論を促進する内容としてください。\n",
+        ]
+
+        if previous_statements:
+            # 相互議論では他者の意見に対する応答を重視
+            parts.append("\n**これまでの議論:**\n")
+            # 冗長な発言でプロンプトが肥大しないよう、1件ごとに
+            # トークン上限で切り詰めてから埋め込む
+            parts.append("".join(
+                f"\n**{stmt.persona_name}（{stmt.persona_role}）の見解:**\n"
+                f"{trim_to_tokens(stmt.statement, _HISTORY_TOKENS_PER_STATEMENT)}\n"
+                for stmt in previous_statements[-5:]  # 最新5件
+            ))
+
+            parts.append(
+                f"\n**ラウンド{round_number}での議論指針:**\n"
+                "上記の意見を踏まえ、以下の観点で応答してください：\n"
+                "1. 他者の意見で共感する点・疑問に思う点\n"
+                "2. あなたの経験から見た追加の課題や視点\n"
+                "3. より実現可能性の高い解決策の提案\n"
+                "4. 具体的な実装方法や注意点\n"
+            )
+
+        parts.append(_JSON_FORMAT_INSTRUCTION)
+        return "".join(parts)
+
+    def _user_prompt_consensus(
+        self,
+        topic: str,
+        context: str,
+        previous_statements: list[PersonaStatement],
+        round_number: int,
+        totals: "tuple[int, int] | None" = None
+    ) -> str:
+        """合意形成用のユーザープロンプトを組み立てる"""
+        parts: list[str] = [
+            self._user_prompt_header(topic, context),
+            "\n**回答形式:**\n"
+            "これまでの議論を統合した最終見解を提示してください。合意事項、実行計画、今後の課題を明確に整理してください。\n",
+        ]
+
+        if previous_statements or totals is not None:
+            # 合意形成では全体的な統合を重視。オーケストレーター側で
+            # 集計済みの件数があれば再集計しない
+            if totals is not None:
+                issues_count, solutions_count = totals
+            else:
+                issues_count = sum(
+                    len(stmt.identified_issues) for stmt in previous_statements
+                )
+                solutions_count = sum(
+                    len(stmt.proposed_solutions) for stmt in previous_statements
+                )
+            parts.append(
+                "\n**全議論の要約:**\n"
+                f"特定された課題: {issues_count}件\n"
+                f"提案された解決策: {solutions_count}件\n"
+                "\n**合意形成の観点:**\n"
+                "1. 最も重要で合意可能な課題を3つ選定する\n"
+                "2. 実現可能性が高い解決策を優先順位付けする\n"
+                "3. 段階的な実装計画を提案する\n"
+                "4. 効果測定の指標を提案する\n"
+            )
+
+        parts.append(_JSON_FORMAT_INSTRUCTION)
+        return "".join(parts)
+
+    def _user_prompt_generic(
+        self,
+        topic: str,
+        context: str,
+        previous_statements: list[PersonaStatement],
+        round_number: int,
+        totals: "tuple[int, int] | None" = None
+    ) -> str:
+        """未知の議論タイプ向けのフォールバック"""
+        return self._user_prompt_header(topic, context) + _JSON_FORMAT_INSTRUCTION
 
     async def _extract_issues_and_solutions(self, statement: str) -> tuple[list[str], list[str]]:
         """発言から課題と解決策を抽出"""
@@ -254,30 +551,25 @@ class PersonaAgent:
             extraction_result = await self.llm.generate(messages)
 
             # 課題と解決策を抽出
-            issues = []
-            solutions = []
+            issues: list[str] = []
+            solutions: list[str] = []
 
-            lines = extraction_result.split('\n')
             current_section = None
+            sections = {"issues": issues, "solutions": solutions}
 
-            for line in lines:
+            for line in extraction_result.split('\n'):
                 line = line.strip()
-                if '課題：' in line or '課題:' in line:
-                    current_section = 'issues'
-                elif '解決策：' in line or '解決策:' in line:
-                    current_section = 'solutions'
-                elif line and (line.startswith('1.') or line.startswith('2.') or
-                              line.startswith('3.') or line.startswith('4.') or
-                              line.startswith('5.')):
-                    content = line[2:].strip()
-                    if current_section == 'issues':
-                        issues.append(content)
-                    elif current_section == 'solutions':
-                        solutions.append(content)
-
-            logger.info(
+                heading = _SECTION_MAP.get(line.strip('* ').rstrip('：:'))
+                if heading is not None:
+                    current_section = heading
+                    continue
+
+                m = _NUM_ITEM_RE.match(line)
+                if m and current_section:
+                    sections[current_section].append(m.group(1).strip())
+
+            self._log.info(
                 "課題・解決策抽出完了",
-                persona=self.profile.name,
                 issues_count=len(issues),
                 solutions_count=len(solutions)
             )
@@ -285,11 +577,7 @@ class PersonaAgent:
             return issues, solutions
 
         except Exception as e:
-            logger.error(
-                "課題・解決策抽出エラー",
-                persona=self.profile.name,
-                error=str(e)
-            )
+            self._log.error("課題・解決策抽出エラー", error=str(e))
             return [], []
 
 
@@ -299,6 +587,7 @@ class BasePersonaAgent:
     def __init__(self, config: PersonaConfig, llm: LLMInterface):
         self.config = config
         self.llm = llm
+        self._log = logger.bind(persona=config.name)
 
     async def discuss(
         self,
@@ -313,25 +602,31 @@ class BasePersonaAgent:
                 topic, context, previous_statements or []
             )
 
-            # LLMで応答を生成
+            # LLMで応答を生成（課題・解決策込みの構造化JSONを要求）
             response = await self.llm.generate(messages)
 
-            # レスポンスから課題と解決策を抽出
-            issues, solutions = self._extract_issues_and_solutions(response)
-
-            # PersonaStatementを作成
-            statement = PersonaStatement(
+            # 構造化応答をパースし、失敗時はキーワード抽出にフォールバック
+            parsed = _parse_persona_response(response)
+            if parsed is not None:
+                statement_text = parsed.statement
+                issues, solutions = parsed.issues[:5], parsed.solutions[:5]
+            else:
+                statement_text = response
+                issues, solutions = self._extract_issues_and_solutions(response)
+
+            # PersonaStatementを作成（検証済みの内部値のみなので
+            # model_construct でバリデーションを省略）
+            statement = PersonaStatement.model_construct(
                 persona_name=self.config.name,
                 persona_role=self.config.role,
-                statement=response,
+                statement=statement_text,
                 identified_issues=issues,
                 proposed_solutions=solutions,
                 llm_model=self.llm.model_name
             )
 
-            logger.info(
+            self._log.info(
                 "ペルソナ発言生成完了",
-                persona=self.config.name,
                 issues_count=len(issues),
                 solutions_count=len(solutions)
             )
@@ -339,11 +634,7 @@ class BasePersonaAgent:
             return statement
 
         except Exception as e:
-            logger.error(
-                "ペルソナ発言生成エラー",
-                persona=self.config.name,
-                error=str(e)
-            )
+            self._log.error("ペルソナ発言生成エラー", error=str(e))
             raise
 
     def _build_conversation_context(
@@ -358,108 +649,69 @@ class BasePersonaAgent:
         ]
 
         # トピックとコンテキストを追加
-        user_content = f"議論テーマ: {topic}\n\n"
+        # （+= の繰り返しを避け、リスト+joinで組み立てる）
+        parts: list[str] = [f"議論テーマ: {topic}\n\n"]
         if context:
-            user_content += f"コンテキスト: {context}\n\n"
+            parts.append(f"コンテキスト: {context}\n\n")
 
         # 他のペルソナの発言があれば追加
         if previous_statements:
-            user_content += "これまでの議論:\n"
+            parts.append("これまでの議論:\n")
             for stmt in previous_statements:
-                user_content += f"\n{stmt.persona_name}({stmt.persona_role})の見解:\n"
-                user_content += f"{stmt.statement}\n"
+                parts.append(
+                    f"\n{stmt.persona_name}({stmt.persona_role})の見解:\n"
+                    f"{stmt.statement}\n"
+                )
                 if stmt.identified_issues:
-                    user_content += f"特定した課題: {', '.join(stmt.identified_issues)}\n"
-            user_content += "\n"
+                    parts.append(
+                        f"特定した課題: {', '.join(stmt.identified_issues)}\n"
+                    )
+            parts.append("\n")
 
-        user_content += (
+        parts.append(
             "上記を踏まえて、あなたの専門領域と経験から見た課題と解決策を述べてください。\n"
             "特に人材マネジメントとプロセス改善の観点から、具体的で実践的な見解をお願いします。"
         )
+        parts.append(_JSON_FORMAT_INSTRUCTION)
 
-        messages.append({"role": "user", "content": user_content})
+        messages.append({"role": "user", "content": "".join(parts)})
 
         return messages
 
     def _extract_issues_and_solutions(self, response: str) -> tuple[list[str], list[str]]:
         """レスポンスから課題と解決策を抽出"""
-        # 簡易的なキーワードベース抽出
-        # 実際の実装ではより高度なNLP処理を行う可能性がある
-
-        issues = []
-        solutions = []
-
-        # 課題を示すキーワード
-        issue_keywords = [
-            "課題", "問題", "困っている", "難しい", "悩み", "リスク",
-            "不足", "欠如", "足りない", "改善が必要", "ボトルネック"
-        ]
-
-        # 解決策を示すキーワード
-        solution_keywords = [
-            "解決策", "対策", "改善案", "提案", "施策", "アプローチ",
-            "実施すべき", "導入", "取り組み", "方法", "戦略"
-        ]
+        # 簡易的なキーワードベース抽出。長さチェックを先に行い、
+        # 統合パターン1回の走査で lastgroup により振り分ける
+        issues: list[str] = []
+        solutions: list[str] = []
+        buckets = {"issues": issues, "solutions": solutions}
 
-        lines = response.split('\n')
-        for line in lines:
+        for line in response.split('\n'):
             line = line.strip()
-            if not line:
+            if len(line) <= 10:
                 continue
 
-            # 課題の抽出
-            for keyword in issue_keywords:
-                if keyword in line and len(line) > 10:
-                    issues.append(line)
-                    break
-
-            # 解決策の抽出
-            for keyword in solution_keywords:
-                if keyword in line and len(line) > 10:
-                    solutions.append(line)
+            m = _KEYWORD_RE.search(line)
+            if m:
+                buckets[m.lastgroup].append(line)
+                # 各5件で十分なので、揃い次第残りの行をスキップする
+                if len(issues) >= 5 and len(solutions) >= 5:
                     break
 
         return issues[:5], solutions[:5]  # 最大5個まで
 
 
-class ITStartupPMAgent(BasePersonaAgent):
-    """ITスタートアップPMペルソナ"""
-    pass
-
-
-class EnterprisePMAgent(BasePersonaAgent):
-    """エンタープライズPMペルソナ"""
-    pass
-
-
-class TechLeadAgent(BasePersonaAgent):
-    """テックリードペルソナ"""
-    pass
-
-
-class ScrumMasterAgent(BasePersonaAgent):
-    """スクラムマスターペルソナ"""
-    pass
-
-
-class EngineeringManagerAgent(BasePersonaAgent):
-    """エンジニアリングマネージャーペルソナ"""
-    pass
-
-
-class HRSpecializedPMAgent(BasePersonaAgent):
-    """HR特化PMペルソナ"""
-    pass
-
-
-class ProductOwnerAgent(BasePersonaAgent):
-    """プロダクトオーナーペルソナ"""
-    pass
-
-
-class SeniorConsultantAgent(BasePersonaAgent):
-    """シニアコンサルタントペルソナ"""
-    pass
+# ペルソナごとの振る舞いはすべてPersonaConfig駆動であり、旧サブクラスは
+# 空のpass定義だったため単一クラスに集約した。既存のimport互換のため
+# 旧クラス名はエイリアスとして残す
+ITStartupPMAgent = BasePersonaAgent
+EnterprisePMAgent = BasePersonaAgent
+TechLeadAgent = BasePersonaAgent
+ScrumMasterAgent = BasePersonaAgent
+EngineeringManagerAgent = BasePersonaAgent
+HRSpecializedPMAgent = BasePersonaAgent
+ProductOwnerAgent = BasePersonaAgent
+SeniorConsultantAgent = BasePersonaAgent
 
 
 class PersonaAgentFactory:
@@ -495,21 +747,7 @@ class PersonaAgentFactory:
             読み込む設定ファイルパス。未指定時は ``DEFAULT_PERSONA_PATH`` を利用する。
         """
         yaml_path = path or DEFAULT_PERSONA_PATH
-        if not yaml_path.exists():
-            raise FileNotFoundError(
-                f"ペルソナ設定ファイルが見つかりません: {yaml_path}"
-            )
-
-        with open(yaml_path, encoding="utf-8") as f:
-            data: dict[str, Any] = yaml.safe_load(f) or {}
-
-        configs = {}
-        for name, persona in data.get("personas", {}).items():
-            config_data = persona.get("config")
-            if config_data:
-                configs[name] = PersonaConfig(**config_data)
-
-        return configs
+        return _build_persona_configs(yaml_path, _stat_mtime_ns(yaml_path))
 
     @staticmethod
     def create_agent(
@@ -535,18 +773,59 @@ class PersonaAgentFactory:
             読み込む設定ファイルパス。未指定時は ``DEFAULT_PERSONA_PATH`` を利用する。
         """
         yaml_path = path or DEFAULT_PERSONA_PATH
-        if not yaml_path.exists():
-            raise FileNotFoundError(
-                f"ペルソナ設定ファイルが見つかりません: {yaml_path}"
-            )
+        return _build_persona_profiles(yaml_path, _stat_mtime_ns(yaml_path))
+
+    @staticmethod
+    async def extract_batch(
+        llm: LLMInterface,
+        statements: list[str]
+    ) -> list[tuple[list[str], list[str]]]:
+        """複数発言の課題・解決策を1回のLLM呼び出しでまとめて抽出
+
+        ラウンドでN件の発言が出揃った後に呼ぶことで、発言ごとの
+        抽出用LLM往復をN回から1回に削減する。パースに失敗した場合は
+        全件に空リストのペアを返す。
+        """
+        if not statements:
+            return []
+
+        # キャッシュが効くよう定型の指示を先頭に、発言本文を末尾に置く
+        parts: list[str] = ["""
+以下の各発言から、具体的な課題と解決策を抽出してください。
 
-        with open(yaml_path, encoding="utf-8") as f:
-            data: dict[str, Any] = yaml.safe_load(f) or {}
+発言と同じ順序で、以下の形式のJSON配列のみを出力してください：
+[{"issues": ["課題1", ...], "solutions": ["解決策1", ...]}, ...]
+"""]
+        for i, statement in enumerate(statements, start=1):
+            parts.append(f"\n---発言{i}---\n{statement}\n")
 
-        profiles = {}
-        for name, persona in data.get("personas", {}).items():
-            profile_data = persona.get("profile")
-            if profile_data:
-                profiles[name] = PersonaProfile(**profile_data)
+        messages = [{"role": "user", "content": "".join(parts)}]
 
-        return profiles
+        try:
+            response = await llm.generate(messages)
+            start = response.find("[")
+            end = response.rfind("]")
+            if start < 0 or end <= start:
+                raise ValueError("JSON配列が見つかりません")
+            raw = response[start:end + 1]
+            items = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if len(items) != len(statements):
+                raise ValueError(
+                    f"件数不一致: expected={len(statements)} got={len(items)}"
+                )
+            results = [
+                (
+                    [str(x) for x in item.get("issues", [])][:5],
+                    [str(x) for x in item.get("solutions", [])][:5],
+                )
+                for item in items
+            ]
+            logger.info("一括抽出完了", statements_count=len(statements))
+            return results
+        except Exception as e:
+            logger.error(
+                "一括抽出エラー",
+                statements_count=len(statements),
+                error=str(e)
+            )
+            return [([], []) for _ in statements]
@@ -2,14 +2,33 @@
 
 import asyncio
 import sys
+from functools import lru_cache
 from typing import Optional
 import os
 
 import click
 
+# uvloop は任意依存。あればlibuvベースのイベントループで
+# LLM呼び出しの高並列なI/Oスケジューリングが高速になる
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from .core.system import PMPLAgentSystem
 
 
+@lru_cache(maxsize=1)
+def _get_system() -> PMPLAgentSystem:
+    """プロセス内で共有するシステムインスタンスを取得
+
+    コマンドごとに設定の再読み込み・ストレージやLLMクライアントの
+    再構築を繰り返さないよう、初回呼び出しで一度だけ初期化する。
+    """
+    return PMPLAgentSystem()
+
+
 @click.group()
 @click.version_option()
 def cli() -> None:
@@ -50,7 +69,7 @@ def start(
                 ]
             
             # システムを初期化
-            system = PMPLAgentSystem()
+            system = _get_system()
             
             click.echo(f"議論セッションを開始します...")
             click.echo(f"テーマ: {topic}")
@@ -90,7 +109,7 @@ def status(session_id: str) -> None:
     
     async def _get_status() -> None:
         try:
-            system = PMPLAgentSystem()
+            system = _get_system()
             session_status = await system.get_session_status(session_id)
             
             click.echo(f"セッション状態:")
@@ -120,7 +139,7 @@ def report(session_id: str, output: Optional[str] = None) -> None:
     
     async def _generate_report() -> None:
         try:
-            system = PMPLAgentSystem()
+            system = _get_system()
             report_content = await system.generate_report(session_id)
             
             # reportsディレクトリを作成（存在しない場合）
@@ -151,7 +170,7 @@ def list() -> None:
     
     async def _list_sessions() -> None:
         try:
-            system = PMPLAgentSystem()
+            system = _get_system()
             sessions = await system.list_sessions()
             
             if not sessions:
@@ -182,7 +201,7 @@ def health() -> None:
     
     async def _health_check() -> None:
         try:
-            system = PMPLAgentSystem()
+            system = _get_system()
             health_result = await system.health_check()
             
             click.echo(f"システム状態: {health_result['status']}")
@@ -1,6 +1,7 @@
 """設定管理システム"""
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from pathlib import Path
 
@@ -8,6 +9,12 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+# libyaml があればCベースのローダーで5-10倍速くパースできる
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class LLMProviderConfig(BaseModel):
     """LLMプロバイダー設定"""
@@ -29,6 +36,8 @@ class DiscussionConfig(BaseModel):
     max_rounds: int = Field(default=3, ge=1, le=5)
     sufficiency_threshold: float = Field(default=75.0, ge=0.0, le=100.0)
     timeout_minutes: int = Field(default=30, gt=0)
+    # 同時に発行するLLM呼び出し数の上限（プロバイダーのレート制限に合わせて調整）
+    max_concurrent_llm: int = Field(default=4, ge=1, le=32)
 
 
 class StorageConfig(BaseModel):
@@ -75,7 +84,7 @@ class Settings(BaseSettings):
             raise FileNotFoundError(f"設定ファイルが見つかりません: {config_path}")
         
         with open(config_path, "r", encoding="utf-8") as f:
-            yaml_data = yaml.safe_load(f)
+            yaml_data = yaml.load(f, Loader=_YamlLoader)
         
         return cls(**yaml_data)
     
@@ -114,5 +123,15 @@ def load_default_config() -> Settings:
             )
         except Exception as e:
             print(f"設定ファイル読み込みエラー: {e}")
-    
-    return settings 
\ No newline at end of file
+
+    return settings
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """プロセス内で共有する設定を取得
+
+    環境変数の読み込み・YAMLパース・バリデーションを繰り返さないよう、
+    初回呼び出しで構築した Settings を以降は使い回す。
+    """
+    return load_default_config() 
\ No newline at end of file
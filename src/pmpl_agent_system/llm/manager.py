@@ -1,10 +1,15 @@
 """LLM管理システム"""
 
 import asyncio
+import random
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
 from enum import Enum
 from typing import Any, Dict, Optional
 
+import anthropic
+import openai
 import structlog
 from openai import AsyncOpenAI
 from anthropic import AsyncAnthropic
@@ -13,6 +18,82 @@ from ..config.settings import LLMProviderConfig, Settings
 
 logger = structlog.get_logger(__name__)
 
+# ヘルスチェック結果のキャッシュ保持秒数
+_HEALTH_CACHE_TTL = 30.0
+
+# トークナイザーは任意依存。無ければ文字数ベースの近似にフォールバックする
+try:
+    import tiktoken
+
+    _TOKEN_ENCODER = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _TOKEN_ENCODER = None
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """テキストをトークン上限内に切り詰める
+
+    上限超過時は先頭と末尾を残して中間を省略する（発言の結論部分は
+    末尾に来ることが多いため）。tiktoken が無い環境では
+    日本語テキストのおおむね1文字≒1トークンという近似で代用する。
+    """
+    half = max_tokens // 2
+    if _TOKEN_ENCODER is not None:
+        tokens = _TOKEN_ENCODER.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        head = _TOKEN_ENCODER.decode(tokens[:half])
+        tail = _TOKEN_ENCODER.decode(tokens[-half:])
+    else:
+        if len(text) <= max_tokens:
+            return text
+        head = text[:half]
+        tail = text[-half:]
+    return f"{head}\n…（中略）…\n{tail}"
+
+
+# 一時的な障害としてリトライ対象にする例外（レート制限・接続・5xx）
+_OPENAI_RETRIABLE = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+_ANTHROPIC_RETRIABLE = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.APITimeoutError,
+    anthropic.InternalServerError,
+)
+
+
+async def _retry_llm_call(
+    call: Callable[[], Awaitable[Any]],
+    retriable: tuple,
+    retry_count: int,
+    base_delay: float = 1.0,
+) -> Any:
+    """一時的な障害に対してジッター付き指数バックオフでリトライ
+
+    429や5xxで即座に失敗させるとペルソナの発言が丸ごと失われ、
+    数分かかるセッション全体のやり直しを強いるため。
+    """
+    for attempt in range(retry_count + 1):
+        try:
+            return await call()
+        except retriable as e:
+            if attempt >= retry_count:
+                raise
+            delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+            logger.warning(
+                "LLM呼び出しをリトライ",
+                attempt=attempt + 1,
+                max_retries=retry_count,
+                delay=round(delay, 2),
+                error=str(e),
+            )
+            await asyncio.sleep(delay)
+
 
 class LLMProvider(Enum):
     """LLMプロバイダー"""
@@ -41,10 +122,32 @@ class LLMInterface(ABC):
         messages: list[dict[str, str]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
     ) -> str:
-        """テキスト生成"""
+        """テキスト生成
+
+        Args:
+            cache_key: プロバイダー側プロンプトキャッシュのヒント。
+                同一のシステムプロンプト・プレフィックスを繰り返し送る
+                呼び出し元が指定すると、入力コストとTTFTを削減できる。
+        """
         pass
     
+    @abstractmethod
+    def stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """テキストをストリーミング生成
+
+        生成済みのテキスト断片を順次yieldする。長い出力でも
+        最初のトークンから順に下流へ流せるため、体感レイテンシが
+        トータルのデコード時間ではなくTTFTに短縮される。
+        """
+        pass
+
     @abstractmethod
     async def generate_with_tools(
         self,
@@ -66,9 +169,10 @@ class LLMInterface(ABC):
 class OpenAILLM(LLMInterface):
     """OpenAI LLM実装"""
     
-    def __init__(self, config: LLMProviderConfig, api_key: str):
+    def __init__(self, config: LLMProviderConfig, client: AsyncOpenAI):
         self.config = config
-        self.client = AsyncOpenAI(api_key=api_key)
+        # クライアントはプロバイダー単位で共有される（接続プールの再利用）
+        self.client = client
         self._model_name = config.model
     
     async def generate(
@@ -76,25 +180,64 @@ class OpenAILLM(LLMInterface):
         messages: list[dict[str, str]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
     ) -> str:
         """テキスト生成"""
         try:
-            response = await self.client.chat.completions.create(
+            extra_params: dict[str, Any] = {}
+            if cache_key:
+                # 同一プレフィックスのキャッシュヒット率を高めるルーティングヒント
+                extra_params["prompt_cache_key"] = cache_key
+
+            async def _call() -> Any:
+                return await self.client.chat.completions.create(
+                    model=self._model_name,
+                    messages=messages,
+                    temperature=temperature or self.config.temperature,
+                    max_tokens=max_tokens or self.config.max_tokens,
+                    timeout=self.config.timeout,
+                    **extra_params,
+                )
+
+            response = await _retry_llm_call(
+                _call, _OPENAI_RETRIABLE, self.config.retry_count
+            )
+            return response.choices[0].message.content or ""
+        except Exception as e:
+            logger.error(
+                "OpenAI API呼び出しエラー",
+                error=str(e),
+                model=self._model_name
+            )
+            raise
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """テキストをストリーミング生成"""
+        try:
+            response_stream = await self.client.chat.completions.create(
                 model=self._model_name,
                 messages=messages,
                 temperature=temperature or self.config.temperature,
                 max_tokens=max_tokens or self.config.max_tokens,
                 timeout=self.config.timeout,
+                stream=True,
             )
-            return response.choices[0].message.content or ""
+            async for chunk in response_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except Exception as e:
             logger.error(
-                "OpenAI API呼び出しエラー",
+                "OpenAI APIストリーミングエラー",
                 error=str(e),
                 model=self._model_name
             )
             raise
-    
+
     async def generate_with_tools(
         self,
         messages: list[dict[str, str]],
@@ -136,9 +279,10 @@ class OpenAILLM(LLMInterface):
 class AnthropicLLM(LLMInterface):
     """Anthropic LLM実装"""
     
-    def __init__(self, config: LLMProviderConfig, api_key: str):
+    def __init__(self, config: LLMProviderConfig, client: AsyncAnthropic):
         self.config = config
-        self.client = AsyncAnthropic(api_key=api_key)
+        # クライアントはプロバイダー単位で共有される（接続プールの再利用）
+        self.client = client
         self._model_name = config.model
     
     async def generate(
@@ -146,37 +290,89 @@ class AnthropicLLM(LLMInterface):
         messages: list[dict[str, str]],
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
     ) -> str:
         """テキスト生成"""
         try:
             # Anthropic APIは system メッセージを分離する必要がある
+            system_message: Any = ""
+            formatted_messages = []
+
+            for msg in messages:
+                if msg["role"] == "system":
+                    system_message = msg["content"]
+                else:
+                    formatted_messages.append(msg)
+
+            if cache_key and system_message:
+                # 安定したシステムプロンプトをキャッシュ可能ブロックとして送る。
+                # キャッシュ境界を静的プレフィックスの末尾に置くことで、
+                # 可変のユーザーメッセージがキャッシュを無効化しない。
+                system_message = [
+                    {
+                        "type": "text",
+                        "text": system_message,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+
+            async def _call() -> Any:
+                return await self.client.messages.create(
+                    model=self._model_name,
+                    system=system_message,
+                    messages=formatted_messages,
+                    temperature=temperature or self.config.temperature,
+                    max_tokens=max_tokens or self.config.max_tokens or 4000,
+                    timeout=self.config.timeout,
+                )
+
+            response = await _retry_llm_call(
+                _call, _ANTHROPIC_RETRIABLE, self.config.retry_count
+            )
+            return response.content[0].text if response.content else ""
+        except Exception as e:
+            logger.error(
+                "Anthropic API呼び出しエラー",
+                error=str(e),
+                model=self._model_name
+            )
+            raise
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """テキストをストリーミング生成"""
+        try:
             system_message = ""
             formatted_messages = []
-            
+
             for msg in messages:
                 if msg["role"] == "system":
                     system_message = msg["content"]
                 else:
                     formatted_messages.append(msg)
-            
-            response = await self.client.messages.create(
+
+            async with self.client.messages.stream(
                 model=self._model_name,
                 system=system_message,
                 messages=formatted_messages,
                 temperature=temperature or self.config.temperature,
                 max_tokens=max_tokens or self.config.max_tokens or 4000,
                 timeout=self.config.timeout,
-            )
-            
-            return response.content[0].text if response.content else ""
+            ) as response_stream:
+                async for text in response_stream.text_stream:
+                    yield text
         except Exception as e:
             logger.error(
-                "Anthropic API呼び出しエラー",
+                "Anthropic APIストリーミングエラー",
                 error=str(e),
                 model=self._model_name
             )
             raise
-    
+
     async def generate_with_tools(
         self,
         messages: list[dict[str, str]],
@@ -235,22 +431,24 @@ class LLMProviderInterface(ABC):
 
 class OpenAIProvider(LLMProviderInterface):
     """OpenAIプロバイダー"""
-    
+
     def __init__(self, api_key: str):
-        self.api_key = api_key
-    
+        # APIキーごとに1つのクライアントを共有し、エージェント数に
+        # 依存せずTCP/TLSハンドシェイクと接続プールを使い回す
+        self._client = AsyncOpenAI(api_key=api_key)
+
     def create_llm(self, config: LLMProviderConfig) -> LLMInterface:
-        return OpenAILLM(config, self.api_key)
+        return OpenAILLM(config, self._client)
 
 
 class AnthropicProvider(LLMProviderInterface):
     """Anthropicプロバイダー"""
-    
+
     def __init__(self, api_key: str):
-        self.api_key = api_key
-    
+        self._client = AsyncAnthropic(api_key=api_key)
+
     def create_llm(self, config: LLMProviderConfig) -> LLMInterface:
-        return AnthropicLLM(config, self.api_key)
+        return AnthropicLLM(config, self._client)
 
 
 class LLMManager:
@@ -260,6 +458,8 @@ class LLMManager:
         self.settings = settings
         self.providers: Dict[LLMProvider, LLMProviderInterface] = {}
         self._llm_cache: Dict[str, LLMInterface] = {}
+        # ヘルスチェック結果の (取得時刻, 結果) キャッシュ
+        self._health_cache: Optional[tuple[float, Dict[str, bool]]] = None
         
         # プロバイダーの初期化
         self._init_providers()
@@ -280,12 +480,22 @@ class LLMManager:
             "LLMプロバイダー初期化完了",
             providers=list(self.providers.keys())
         )
-    
+
+        # 設定済みエージェントのLLMインスタンスを事前構築しておくと、
+        # 発言ごとの get_llm はdict参照1回で返る
+        for agent_name in self.settings.agents:
+            try:
+                self.get_llm(agent_name)
+            except ValueError:
+                # プロバイダーのAPIキー未設定などは利用時にエラーにする
+                continue
+
     def get_llm(self, agent_name: str) -> LLMInterface:
         """エージェント用LLMインスタンス取得"""
-        # キャッシュから取得
-        if agent_name in self._llm_cache:
-            return self._llm_cache[agent_name]
+        # キャッシュから取得（ホットパスはこの1参照で完結する）
+        llm = self._llm_cache.get(agent_name)
+        if llm is not None:
+            return llm
         
         # 設定を取得
         config = self.settings.get_agent_config(agent_name)
@@ -317,39 +527,60 @@ class LLMManager:
         self._llm_cache.clear()
         logger.info("LLMキャッシュをクリアしました")
     
+    async def _check_provider(
+        self, provider_enum: "LLMProvider", provider: "LLMProviderInterface"
+    ) -> tuple[str, bool]:
+        """プロバイダー1件のヘルスチェック"""
+        try:
+            # 簡単なテスト用LLMインスタンスを作成
+            test_config = LLMProviderConfig(
+                provider=provider_enum.value,
+                model="gpt-3.5-turbo" if provider_enum == LLMProvider.OPENAI else "claude-3-haiku-20240307",
+                temperature=0.1,
+                max_tokens=10
+            )
+
+            llm = provider.create_llm(test_config)
+
+            # 簡単なテストメッセージ
+            test_messages = [{"role": "user", "content": "Hello"}]
+
+            # タイムアウト付きでテスト
+            await asyncio.wait_for(
+                llm.generate(test_messages),
+                timeout=10.0
+            )
+
+            return provider_enum.value, True
+
+        except Exception as e:
+            logger.warning(
+                "プロバイダーヘルスチェック失敗",
+                provider=provider_enum.value,
+                error=str(e)
+            )
+            return provider_enum.value, False
+
     async def health_check(self) -> Dict[str, bool]:
-        """各プロバイダーのヘルスチェック"""
-        results = {}
-        
-        for provider_enum, provider in self.providers.items():
-            try:
-                # 簡単なテスト用LLMインスタンスを作成
-                test_config = LLMProviderConfig(
-                    provider=provider_enum.value,
-                    model="gpt-3.5-turbo" if provider_enum == LLMProvider.OPENAI else "claude-3-haiku-20240307",
-                    temperature=0.1,
-                    max_tokens=10
-                )
-                
-                llm = provider.create_llm(test_config)
-                
-                # 簡単なテストメッセージ
-                test_messages = [{"role": "user", "content": "Hello"}]
-                
-                # タイムアウト付きでテスト
-                await asyncio.wait_for(
-                    llm.generate(test_messages),
-                    timeout=10.0
-                )
-                
-                results[provider_enum.value] = True
-                
-            except Exception as e:
-                logger.warning(
-                    "プロバイダーヘルスチェック失敗",
-                    provider=provider_enum.value,
-                    error=str(e)
+        """各プロバイダーのヘルスチェック
+
+        プロバイダーごとの確認を並列に発行するため、最悪ケースでも
+        1プロバイダー分のタイムアウト（10秒）で完了する。結果は
+        短時間キャッシュし、/health のポーリングでプロバイダーへ
+        テスト呼び出しを連打しない。
+        """
+        if self._health_cache is not None:
+            checked_at, results = self._health_cache
+            if time.monotonic() - checked_at < _HEALTH_CACHE_TTL:
+                return results
+
+        results = dict(
+            await asyncio.gather(
+                *(
+                    self._check_provider(provider_enum, provider)
+                    for provider_enum, provider in self.providers.items()
                 )
-                results[provider_enum.value] = False
-        
+            )
+        )
+        self._health_cache = (time.monotonic(), results)
         return results 
\ No newline at end of file
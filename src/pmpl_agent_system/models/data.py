@@ -1,11 +1,13 @@
 """データモデル定義"""
 
+from collections import deque
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class DiscussionStatus(Enum):
@@ -33,6 +35,19 @@ class IssuePriority(Enum):
     LOW = "low"
 
 
+class PersonaResponse(BaseModel):
+    """ペルソナLLM応答の構造化スキーマ
+
+    発言と課題・解決策を1回の生成でまとめて受け取るための形式。
+    抽出専用の2回目のLLM呼び出しを不要にする。
+    """
+    statement: str = Field(..., description="発言本文")
+    issues: List[str] = Field(default_factory=list, description="特定した課題")
+    solutions: List[str] = Field(
+        default_factory=list, description="提案した解決策"
+    )
+
+
 class PersonaStatement(BaseModel):
     """ペルソナの発言"""
     persona_name: str = Field(..., description="ペルソナ名")
@@ -47,6 +62,15 @@ class PersonaStatement(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="発言時刻")
     llm_model: str = Field(..., description="使用したLLMモデル")
 
+    @cached_property
+    def preview(self) -> str:
+        """発言冒頭200文字のプレビュー
+
+        プロンプト組み立てループで毎回スライスし直さないよう、
+        初回アクセス時に一度だけ計算して保持する。
+        """
+        return self.statement[:200]
+
 
 class DiscussionRound(BaseModel):
     """議論ラウンド"""
@@ -58,17 +82,88 @@ class DiscussionRound(BaseModel):
     identified_issues: List[str] = Field(
         default_factory=list, description="このラウンドで特定された課題"
     )
+    proposed_solutions: List[str] = Field(
+        default_factory=list, description="このラウンドで提案された解決策"
+    )
     started_at: datetime = Field(
         default_factory=datetime.now, description="開始時刻"
     )
     completed_at: Optional[datetime] = Field(default=None, description="完了時刻")
-    
+
+    # 発言追加時に増分更新される整形済みバッファ
+    # （合意形成・総まとめのたびに全発言を再フォーマットしないため）
+    _formatted_chunks: List[str] = PrivateAttr(default_factory=list)
+    # 焦点特定用の直近発言サマリー（最新5件のみ保持）
+    _recent_formatted: deque = PrivateAttr(
+        default_factory=lambda: deque(maxlen=5)
+    )
+    # プロンプト構築用の直近発言ウィンドウ（最新5件のみ保持）。
+    # 全発言リストのスライス・コピーを議論の長さに依存させないため
+    _recent_statements: deque = PrivateAttr(
+        default_factory=lambda: deque(maxlen=5)
+    )
+
     def add_statement(self, statement: PersonaStatement) -> None:
-        """発言を追加"""
+        """発言を追加
+
+        課題・解決策の集計と整形済みバッファはここで増分更新されるため、
+        総まとめ時に全発言を再走査する必要はない。並行実行中のペルソナ
+        タスクからは呼ばず、gather 完了後にイベントループ上で順次呼ぶこと
+        （ロック不要の前提条件）。
+        """
         self.statements.append(statement)
         if statement.identified_issues:
             self.identified_issues.extend(statement.identified_issues)
-    
+        if statement.proposed_solutions:
+            self.proposed_solutions.extend(statement.proposed_solutions)
+        self._formatted_chunks.append(
+            f"{statement.persona_name}({statement.persona_role}): {statement.statement}"
+        )
+        self._recent_formatted.append(
+            f"{statement.persona_name}: {statement.statement[:300]}..."
+        )
+        self._recent_statements.append(statement)
+
+    def recent_statements(self) -> List[PersonaStatement]:
+        """直近の発言（最新5件）のコピーを取得
+
+        議論が長くなっても O(ウィンドウ幅) で済む。返り値は独立した
+        リストなので、並行タスクへのスナップショットとしてそのまま渡せる。
+        """
+        self._ensure_formatted_buffers()
+        return list(self._recent_statements)
+
+    def recent_summary(self) -> str:
+        """直近の発言（最新5件）の要約表示を取得"""
+        self._ensure_formatted_buffers()
+        return "\n\n".join(self._recent_formatted)
+
+    def formatted_all(self) -> str:
+        """全発言を「名前(役職): 発言」形式で結合して取得"""
+        self._ensure_formatted_buffers()
+        return "\n\n".join(self._formatted_chunks)
+
+    def _ensure_formatted_buffers(self) -> None:
+        """整形済みバッファを発言リストと同期
+
+        デシリアライズ直後など、add_statement を経由せずに statements が
+        設定されている場合はバッファを再構築する。
+        """
+        if len(self._formatted_chunks) == len(self.statements):
+            return
+        self._formatted_chunks = [
+            f"{stmt.persona_name}({stmt.persona_role}): {stmt.statement}"
+            for stmt in self.statements
+        ]
+        self._recent_formatted = deque(
+            (
+                f"{stmt.persona_name}: {stmt.statement[:300]}..."
+                for stmt in self.statements[-5:]
+            ),
+            maxlen=5,
+        )
+        self._recent_statements = deque(self.statements[-5:], maxlen=5)
+
     def complete_round(self) -> None:
         """ラウンドを完了"""
         self.completed_at = datetime.now()
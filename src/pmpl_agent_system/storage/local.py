@@ -1,77 +1,268 @@
 """ローカルファイルストレージ実装"""
 
+import asyncio
 import json
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict
 
-import aiofiles
+import structlog
+from pydantic import ValidationError
 
 from ..models.data import DiscussionSession
 
+logger = structlog.get_logger(__name__)
+
+# ファイルI/O専用ワーカースレッド数。
+# 同時に開くFD数の上限を兼ね、一覧取得のバーストでも
+# スレッドの生成・破棄を繰り返さない
+_IO_WORKERS = 16
+
+# パース済みセッションのキャッシュ保持件数
+_SESSION_CACHE_MAX = 128
+
+
+def _read_text(path: Path) -> str:
+    """ワーカースレッド内で1回のディスパッチで読み切る"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _write_text(path: Path, payload: str) -> None:
+    """ワーカースレッド内で1回のディスパッチで書き切る"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(payload)
+
 
 class LocalStorage:
     """ローカルファイルストレージ"""
-    
+
     def __init__(self, storage_path: str = "./data/discussions"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
-    
-    async def save_session(self, session: DiscussionSession) -> None:
-        """セッションを保存"""
+        # 専用の固定スレッドプール。open/read/writeを個別にスレッドへ
+        # 投げ直す方式（aiofiles）と違い、ファイル1件をワーカー1往復で
+        # 処理するためループとの行き来が最小で済む
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=_IO_WORKERS, thread_name_prefix="pmpl-io"
+        )
+        # セッション一覧表示用のサマリーインデックス
+        # （一覧のたびに全セッションファイルを開かないための要約行）
+        self._index_path = self.storage_path / "index.jsonl"
+        self._index: Optional[Dict[str, Dict]] = None
+        # インデックス書き出しの直列化。並行saveが同じ一時ファイルを
+        # 取り合ってos.replaceに失敗しないようにする
+        self._index_lock = asyncio.Lock()
+        # パース済みセッションのLRUキャッシュ。
+        # (session_id, mtime_ns) をキーにするため、ファイルが更新されると
+        # 自動的にミスして読み直す
+        self._session_cache: OrderedDict[
+            tuple[str, int], DiscussionSession
+        ] = OrderedDict()
+        # 破損と判明したファイル。次回の一覧取得では開き直さず
+        # 例外（トレースバック構築）を毎回払わないようにする
+        self._corrupt_files: set[Path] = set()
+
+    async def _run_io(self, fn, *args):
+        """ブロッキングI/Oを専用プールで実行"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._io_pool, fn, *args
+        )
+
+    @staticmethod
+    def _summary_row(session: DiscussionSession) -> Dict:
+        """インデックスに保持するセッション要約行を作成"""
+        return {
+            "session_id": session.session_id,
+            "topic": session.topic,
+            "status": session.status.value,
+            "created_at": session.created_at.isoformat(),
+            "rounds_count": len(session.rounds),
+        }
+
+    async def _ensure_index(self) -> Dict[str, Dict]:
+        """サマリーインデックスをロード（無ければ全走査で再構築）"""
+        if self._index is not None:
+            return self._index
+
+        if self._index_path.exists():
+            index: Dict[str, Dict] = {}
+            try:
+                raw = await self._run_io(_read_text, self._index_path)
+                for line in raw.splitlines():
+                    if line:
+                        row = json.loads(line)
+                        index[row["session_id"]] = row
+                self._index = index
+                return index
+            except Exception:
+                # 壊れたインデックスは捨てて再構築する
+                pass
+
+        sessions = await self.list_sessions()
+        self._index = {
+            session.session_id: self._summary_row(session)
+            for session in sessions
+        }
+        await self._write_index()
+        return self._index
+
+    async def _write_index(self) -> None:
+        """インデックスを一時ファイル経由でアトミックに書き出す"""
+        if self._index is None:
+            return
+        tmp_path = self._index_path.with_suffix(".jsonl.tmp")
+        async with self._index_lock:
+            lines = "".join(
+                json.dumps(row, ensure_ascii=False) + "\n"
+                for row in self._index.values()
+            )
+            await self._run_io(_write_text, tmp_path, lines)
+            os.replace(tmp_path, self._index_path)
+
+    async def save_session(
+        self, session: DiscussionSession, pretty: bool = False
+    ) -> None:
+        """セッションを保存
+
+        Args:
+            pretty: Trueでインデント付きのJSONを出力する（デバッグ用）。
+                既定はコンパクト形式で、ファイルサイズを3-4割削減し
+                シリアライザの整形パスも省略する。
+        """
         session_file = self.storage_path / f"{session.session_id}.json"
-        
-        # Pydanticモデルをdict形式でJSONシリアライズ
-        session_data = session.model_dump(mode="json")
-        
-        async with aiofiles.open(session_file, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(session_data, ensure_ascii=False, indent=2))
-    
+
+        # pydantic-core のシリアライザで中間dictを経由せず1パスでJSON化する
+        payload = session.model_dump_json(indent=2 if pretty else None)
+
+        # 一時ファイルに書いてからアトミックに差し替える。
+        # 書き込み途中のクラッシュで壊れたJSONが残り、以降の一覧取得が
+        # 毎回パース例外を踏むのを防ぐ（インデックスと同じ方式）
+        tmp_path = session_file.with_suffix(".json.tmp")
+        await self._run_io(_write_text, tmp_path, payload)
+        os.replace(tmp_path, session_file)
+
+        # 旧mtimeのキャッシュエントリは二度とヒットしないため破棄。
+        # 上書きされたファイルは破損扱いも解除する
+        self._evict_cached(session.session_id)
+        self._corrupt_files.discard(session_file)
+
+        # サマリーインデックスを更新
+        index = await self._ensure_index()
+        index[session.session_id] = self._summary_row(session)
+        await self._write_index()
+
+    async def list_session_summaries(self) -> List[Dict]:
+        """全セッションの要約行を新しい順で取得
+
+        インデックスだけを読むため、セッションファイルを1件も開かずに
+        済む（一覧表示はこの要約情報しか使わない）。
+        """
+        index = await self._ensure_index()
+        return sorted(
+            index.values(), key=lambda row: row["created_at"], reverse=True
+        )
+
+    async def _read_session_file(
+        self, session_file: Path
+    ) -> Optional[DiscussionSession]:
+        """セッションファイルを1件読み込み（破損時はNone）
+
+        例外は想定されるものに限定して捕捉する。破損ファイルは
+        記録しておき、以降の一覧取得でスキップする。
+        """
+        try:
+            raw = await self._run_io(_read_text, session_file)
+        except OSError as e:
+            logger.warning(
+                "セッションファイルを読み込めません",
+                path=str(session_file),
+                error=str(e),
+            )
+            return None
+        try:
+            # 中間dictを作らず pydantic-core のバリデータへ直接渡す
+            return DiscussionSession.model_validate_json(raw)
+        except ValidationError as e:
+            self._corrupt_files.add(session_file)
+            logger.warning(
+                "破損したセッションファイルをスキップ",
+                path=str(session_file),
+                errors=e.error_count(),
+            )
+            return None
+
+    def _evict_cached(self, session_id: str) -> None:
+        """指定セッションのキャッシュエントリを破棄"""
+        for key in [k for k in self._session_cache if k[0] == session_id]:
+            del self._session_cache[key]
+
     async def load_session(self, session_id: str) -> Optional[DiscussionSession]:
-        """セッションを読み込み"""
+        """セッションを読み込み
+
+        status・report・詳細表示が同じセッションを繰り返し読むため、
+        パース済みモデルを (session_id, mtime_ns) キーでキャッシュし、
+        2回目以降のJSONパース（pydanticバリデーション）を省略する。
+        """
         session_file = self.storage_path / f"{session_id}.json"
-        
-        if not session_file.exists():
-            return None
-        
+
         try:
-            async with aiofiles.open(session_file, "r", encoding="utf-8") as f:
-                session_data = json.loads(await f.read())
-            
-            return DiscussionSession.model_validate(session_data)
-        except Exception:
+            stat = await self._run_io(os.stat, session_file)
+        except OSError:
             return None
-    
+
+        key = (session_id, stat.st_mtime_ns)
+        cached = self._session_cache.get(key)
+        if cached is not None:
+            self._session_cache.move_to_end(key)
+            return cached
+
+        session = await self._read_session_file(session_file)
+        if session is not None:
+            self._evict_cached(session_id)
+            self._session_cache[key] = session
+            if len(self._session_cache) > _SESSION_CACHE_MAX:
+                self._session_cache.popitem(last=False)
+        return session
+
     async def list_sessions(self) -> List[DiscussionSession]:
-        """すべてのセッションを一覧取得"""
-        sessions = []
-        
-        for session_file in self.storage_path.glob("*.json"):
-            try:
-                async with aiofiles.open(session_file, "r", encoding="utf-8") as f:
-                    session_data = json.loads(await f.read())
-                
-                session = DiscussionSession.model_validate(session_data)
-                sessions.append(session)
-            except Exception:
-                # 破損したファイルはスキップ
-                continue
-        
+        """すべてのセッションを一覧取得
+
+        ファイル読み込みは独立したI/Oなので、逐次awaitせず
+        並列に発行する（同時実行数はI/Oプールのワーカー数で頭打ち）。
+        """
+        session_files = [
+            f
+            for f in self.storage_path.glob("*.json")
+            if f not in self._corrupt_files
+        ]
+        results = await asyncio.gather(
+            *(self._read_session_file(f) for f in session_files)
+        )
+        # 破損したファイル（None）はスキップ
+        sessions = [s for s in results if s is not None]
+
         return sorted(sessions, key=lambda x: x.created_at, reverse=True)
-    
+
     async def delete_session(self, session_id: str) -> bool:
         """セッションを削除"""
         session_file = self.storage_path / f"{session_id}.json"
-        
+
         if session_file.exists():
             try:
                 os.remove(session_file)
-                return True
             except Exception:
                 return False
-        
+            self._evict_cached(session_id)
+            index = await self._ensure_index()
+            if index.pop(session_id, None) is not None:
+                await self._write_index()
+            return True
+
         return False
-    
+
     async def health_check(self) -> Dict[str, any]:  # type: ignore
         """ストレージヘルスチェック"""
         try:
@@ -81,15 +272,15 @@ class LocalStorage:
                     "status": "unhealthy",
                     "error": "ストレージディレクトリが存在しません"
                 }
-            
+
             # 書き込み権限確認
             test_file = self.storage_path / ".health_check"
             test_file.write_text("test")
             test_file.unlink()
-            
+
             # ファイル数カウント
             file_count = len(list(self.storage_path.glob("*.json")))
-            
+
             return {
                 "status": "healthy",
                 "storage_path": str(self.storage_path),
@@ -100,4 +291,4 @@ class LocalStorage:
             return {
                 "status": "unhealthy",
                 "error": str(e)
-            } 
\ No newline at end of file
+            }
@@ -0,0 +1,177 @@
+"""SQLiteストレージ実装"""
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..models.data import DiscussionSession
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    rounds_count INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_created_at
+    ON sessions (created_at);
+"""
+
+
+class SqliteStorage:
+    """SQLiteベースのセッションストレージ
+
+    ファイル1件=セッション1件の方式は、一覧取得のたびにglobと
+    ファイルごとのstat/openを払いセッション数に比例して遅くなる。
+    こちらは一覧・要約・削除をインデックス探索の単一クエリで行う。
+    settings.storage.type を "database" にすると選択される。
+
+    sqlite3の接続はスレッドに紐づくため、専用ワーカー1本の
+    プールに全クエリを閉じ込め、イベントループを塞がない。
+    """
+
+    def __init__(self, storage_path: str = "./data/discussions"):
+        self.storage_path = Path(storage_path)
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.storage_path / "sessions.db"
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pmpl-db"
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """ワーカースレッド内で接続を遅延初期化"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # WALモード + synchronous=NORMAL で
+            # コミットごとのfsync待ちを大幅に減らす
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run_db(self, fn, *args):
+        """クエリを専用ワーカースレッドで実行"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._io_pool, fn, *args
+        )
+
+    def _upsert(self, session: DiscussionSession, payload: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    session.session_id,
+                    session.topic,
+                    session.status.value,
+                    session.created_at.isoformat(),
+                    len(session.rounds),
+                    payload,
+                ),
+            )
+
+    async def save_session(
+        self, session: DiscussionSession, pretty: bool = False
+    ) -> None:
+        """セッションを保存（単一トランザクションでupsert）"""
+        payload = session.model_dump_json(indent=2 if pretty else None)
+        await self._run_db(self._upsert, session, payload)
+
+    def _select_payload(self, session_id: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT payload FROM sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    async def load_session(self, session_id: str) -> Optional[DiscussionSession]:
+        """セッションを読み込み"""
+        payload = await self._run_db(self._select_payload, session_id)
+        if payload is None:
+            return None
+        try:
+            return DiscussionSession.model_validate_json(payload)
+        except Exception:
+            return None
+
+    def _select_all_payloads(self) -> List[str]:
+        return [
+            row[0]
+            for row in self._connect().execute(
+                "SELECT payload FROM sessions ORDER BY created_at DESC"
+            )
+        ]
+
+    async def list_sessions(self) -> List[DiscussionSession]:
+        """すべてのセッションを新しい順で取得"""
+        payloads = await self._run_db(self._select_all_payloads)
+        sessions = []
+        for payload in payloads:
+            try:
+                sessions.append(DiscussionSession.model_validate_json(payload))
+            except Exception:
+                # 破損した行はスキップ
+                continue
+        return sessions
+
+    def _select_summaries(self) -> List[Dict]:
+        return [
+            {
+                "session_id": row[0],
+                "topic": row[1],
+                "status": row[2],
+                "created_at": row[3],
+                "rounds_count": row[4],
+            }
+            for row in self._connect().execute(
+                "SELECT session_id, topic, status, created_at, rounds_count "
+                "FROM sessions ORDER BY created_at DESC"
+            )
+        ]
+
+    async def list_session_summaries(self) -> List[Dict]:
+        """全セッションの要約行を新しい順で取得
+
+        payload列を読まないため、セッション本体のサイズに
+        依存しない一定コストで一覧を返せる。
+        """
+        return await self._run_db(self._select_summaries)
+
+    def _delete(self, session_id: str) -> bool:
+        conn = self._connect()
+        with conn:
+            cur = conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+        return cur.rowcount > 0
+
+    async def delete_session(self, session_id: str) -> bool:
+        """セッションを削除"""
+        return await self._run_db(self._delete, session_id)
+
+    def _count(self) -> int:
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM sessions"
+        ).fetchone()[0]
+
+    async def health_check(self) -> Dict[str, any]:  # type: ignore
+        """ストレージヘルスチェック"""
+        try:
+            count = await self._run_db(self._count)
+            return {
+                "status": "healthy",
+                "storage_path": str(self.db_path),
+                "file_count": count,
+                "writable": True,
+            }
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e)
+            }
@@ -0,0 +1,43 @@
+"""テスト共通フィクスチャ"""
+
+import json
+
+import pytest
+
+from pmpl_agent_system.llm import manager as llm_manager
+
+# ペルソナの構造化出力スキーマ（PersonaResponse）に合わせた決定的な応答
+_CANNED_RESPONSE = json.dumps(
+    {
+        "statement": "モックLLMによるテスト発言です。人材確保が課題です。",
+        "issues": ["採用競争の激化", "オンボーディング負荷"],
+        "solutions": ["採用プロセスの標準化"],
+    },
+    ensure_ascii=False,
+)
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """LLM呼び出しを即座に返る固定応答へ差し替える
+
+    ネットワークとAPIキーなしでシステム全体のフローを実行できる。
+    戻り値は呼び出しごとのメッセージリスト（呼び出し回数の検証用）。
+    """
+    calls = []
+
+    async def _fake_generate(self, messages, **kwargs):
+        calls.append(messages)
+        return _CANNED_RESPONSE
+
+    async def _fake_stream(self, messages, **kwargs):
+        calls.append(messages)
+        yield _CANNED_RESPONSE
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(llm_manager.OpenAILLM, "generate", _fake_generate)
+    monkeypatch.setattr(llm_manager.AnthropicLLM, "generate", _fake_generate)
+    # 総まとめはstream()経由のため、こちらも差し替えないと実APIに出る
+    monkeypatch.setattr(llm_manager.OpenAILLM, "stream", _fake_stream)
+    monkeypatch.setattr(llm_manager.AnthropicLLM, "stream", _fake_stream)
+    return calls
@@ -1,5 +1,8 @@
 """基本テストケース"""
 
+import os
+import timeit
+
 import pytest
 from datetime import datetime
 
@@ -9,24 +12,40 @@ from pmpl_agent_system.models.data import (
     PersonaStatement,
     DiscussionRound,
 )
-from pmpl_agent_system.config.settings import Settings, LLMProviderConfig
+from pmpl_agent_system.config.settings import (
+    Settings,
+    LLMProviderConfig,
+    get_settings,
+)
 
 
 class TestDataModels:
     """データモデルのテスト"""
     
-    def test_discussion_session_creation(self):
+    @pytest.mark.parametrize("company_size", [1, 30, 1000])
+    def test_discussion_session_creation(self, company_size):
         """DiscussionSessionの作成テスト"""
         session = DiscussionSession(
             topic="テストトピック",
-            organization_context={"company_size": 30}
+            organization_context={"company_size": company_size}
         )
-        
+
         assert session.topic == "テストトピック"
-        assert session.organization_context["company_size"] == 30
+        assert session.organization_context["company_size"] == company_size
         assert session.status == DiscussionStatus.INITIALIZED
         assert len(session.session_id) > 0
         assert isinstance(session.created_at, datetime)
+
+        # PMPL_PERF=1 のときだけモデル構築速度の回帰を検知する
+        if os.getenv("PMPL_PERF") == "1":
+            elapsed = timeit.timeit(
+                lambda: DiscussionSession(
+                    topic="テストトピック",
+                    organization_context={"company_size": company_size},
+                ),
+                number=10_000,
+            )
+            assert elapsed < 0.5
     
     def test_persona_statement_creation(self):
         """PersonaStatementの作成テスト"""
@@ -109,6 +128,10 @@ class TestSettings:
         # エージェント別設定がある場合のテスト
         # （実際の設定は個別に追加する必要がある）
 
+    def test_settings_cached(self):
+        """get_settingsが同一インスタンスを返すテスト"""
+        assert get_settings() is get_settings()
+
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file